@@ -3,33 +3,40 @@
 import os
 import sys
 from enum import Enum
+from collections import Counter, deque
 import yaml
 import re
 import shutil
 import math
+import mmap
 import wave
-import pydub
-from moviepy.editor import ImageSequenceClip, AudioFileClip
+import struct
 import numpy as np
 import time
 import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import webbrowser
-from proglog import ProgressBarLogger
-from PIL import Image, ImageOps
-from PyQt5.QtCore import Qt, QUrl, QTimer, QSize
+from PIL import Image
+from PyQt5.QtCore import (
+    Qt, QUrl, QTimer, QSize,
+    QObject, pyqtSignal,
+    QRunnable, QThreadPool, QEventLoop
+)
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QGridLayout, QHBoxLayout, QVBoxLayout,
     QLabel, QPushButton,
-    QFileDialog, QAction,
+    QFileDialog,
     QDialog, QDialogButtonBox, QComboBox, QLineEdit, QCheckBox,
     QSpinBox, QDoubleSpinBox,
     QMessageBox,
     QAbstractButton,
     QSlider, QDial,
     QStyle,
-    QProgressDialog
+    QProgressDialog,
+    QWIDGETSIZE_MAX
 )
 from PyQt5.QtGui import (
     QImage, QPixmap, QIcon,
@@ -101,9 +108,64 @@ ICON_PATH = {
     "watermark": os.path.join(RESOURCE_PATH, "watermark.png")
 }
 
+# Dicts to store loaded icons and pixmaps, so each one is only decoded once
+ICON_CACHE = dict()
+PIXMAP_CACHE = dict()
+# Futures of QImages being decoded in the background, see preload_images
+IMAGE_PRELOADS = dict()
+
+
+def get_icon(path):
+    if path not in ICON_CACHE:
+        ICON_CACHE[path] = QIcon(path)
+
+    return ICON_CACHE[path]
+
+
+# Pixmaps are cached per scale, so scaled versions are only resampled once
+def get_pixmap(path, scale=1.0):
+    key = (path, scale)
+    if key not in PIXMAP_CACHE:
+        if scale != 1.0:
+            pixmap = get_pixmap(path)
+            PIXMAP_CACHE[key] = pixmap.scaled(
+                round(pixmap.width() * scale),
+                round(pixmap.height() * scale),
+                Qt.IgnoreAspectRatio,
+                Qt.SmoothTransformation
+            )
+        elif path in IMAGE_PRELOADS:
+            # QPixmaps must be made on the GUI thread, so only the conversion happens here
+            PIXMAP_CACHE[key] = QPixmap.fromImage(IMAGE_PRELOADS.pop(path).result())
+        else:
+            PIXMAP_CACHE[key] = QPixmap(path)
+
+    return PIXMAP_CACHE[key]
+
+
+# Get the (base, hover, clicked) pixmaps of the button ICON_PATH["button"][name]
+def get_button_pixmaps(name, scale=1.0):
+    button_paths = ICON_PATH["button"][name]
+    return (
+        get_pixmap(button_paths["base"], scale),
+        get_pixmap(button_paths["hover"], scale),
+        get_pixmap(button_paths["clicked"], scale)
+    )
+
+
+# Start decoding images as QImages on worker threads, for get_pixmap to pick up later
+def preload_images(paths):
+    executor = ThreadPoolExecutor()
+    for path in paths:
+        if (path, 1.0) not in PIXMAP_CACHE and path not in IMAGE_PRELOADS:
+            IMAGE_PRELOADS[path] = executor.submit(QImage, path)
+    executor.shutdown(wait=False)
+
 
 # Get licensing status
 class KeyValidate:
+    KEY_PATTERN = re.compile(r"^[A-F0-9]{5}-[A-F0-9]{5}-[A-F0-9]{5}-[A-F0-9]{5}$")
+
     def __init__(self,
                  program_id
                  ):
@@ -111,30 +173,24 @@ class KeyValidate:
 
     def set_program_id(self, program_id):
         self.program_id = program_id.strip()
-        self.program_int = 0
-        for x in self.program_id:
-            self.program_int += ord(x)
-        self.program_int %= 0x10000
+        self.program_int = sum(map(ord, self.program_id)) % 0x10000
         self.program_offset = self.program_int % 5
+        self.program_magic = self.get_magic()
 
     def get_program_hex(self):
-        hex_string = hex(self.program_int)[2:].upper()
-        while len(hex_string) < 4:
-            hex_string = "0" + hex_string
-        return hex_string
+        return f"{self.program_int:04X}"
 
     def get_magic(self, hex_string=None):
         if hex_string is None:
             hex_string = self.get_program_hex()
         int_list = [int(x, 16) for x in hex_string]
         offset = int_list[0]
-        magic_list = [(x - offset) % 16 for x in int_list]
-        magic = "".join([hex(x)[2:] for x in magic_list]).upper()
+        magic = "".join([f"{(x - offset) % 16:X}" for x in int_list])
 
         return magic
 
     def is_key_valid(self, key):
-        if not re.match(r"^[A-F0-9]{5}-[A-F0-9]{5}-[A-F0-9]{5}-[A-F0-9]{5}$", key):
+        if not self.KEY_PATTERN.match(key):
             return False
 
         groups = key.split("-")
@@ -143,11 +199,11 @@ class KeyValidate:
             key_idx = (self.program_int - idx) % 5
             magic_hex += group[key_idx]
 
-        if self.get_magic(magic_hex) == self.get_magic():
-            return True
-        else:
-            return False
+        return self.get_magic(magic_hex) == self.program_magic
+
 
+# One validator for the whole program, the program ID never changes
+KEY_VALIDATOR = KeyValidate(TITLE)
 
 USER_DIR = os.path.expanduser("~")
 if sys.platform == "win32":
@@ -164,7 +220,7 @@ if os.path.isfile(KEY_FILE):
     with open(KEY_FILE, "r") as f:
         SERIAL_KEY = f.read()
     SERIAL_KEY = SERIAL_KEY.strip("\n").strip("\r").strip()
-    IS_REGISTERED = KeyValidate(TITLE).is_key_valid(SERIAL_KEY)
+    IS_REGISTERED = KEY_VALIDATOR.is_key_valid(SERIAL_KEY)
 
     if not IS_REGISTERED:
         os.remove(KEY_FILE)
@@ -179,6 +235,28 @@ DONATE_URL = "https://www.patreon.com/nimaid"
 REGISTER_URL = "https://www.patreon.com/nimaid/shop/binary-waterfall-pro-serial-key-license-69386"
 PROJECT_URL = "https://github.com/nimaid/binary-waterfall"
 
+# Alignment flags used throughout the GUI, combined once
+ALIGN_RIGHT = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight
+ALIGN_LEFT = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+# The size of the seek bar handle, in pixels
+SEEKBAR_HANDLE_SIZE = 10
+
+# The stylesheet for the whole program, set once on the QApplication
+APP_STYLESHEET = (
+    f"QSlider#seekBar::handle {{ background: #666; height: {SEEKBAR_HANDLE_SIZE}px; "
+    f"width: {SEEKBAR_HANDLE_SIZE}px; border-radius: {SEEKBAR_HANDLE_SIZE // 2}px; }} "
+    f"QSlider#seekBar::handle:hover {{ background: #000; height: {SEEKBAR_HANDLE_SIZE}px; "
+    f"width: {SEEKBAR_HANDLE_SIZE}px; border-radius: {SEEKBAR_HANDLE_SIZE // 2}px; }} "
+    "QSlider#volumeSlider::handle { background: #666; } "
+    "QSlider#volumeSlider::handle:hover { background: #000; }"
+)
+
+# The text for the about dialog, built from the constants above
+ABOUT_TEXT = (f"{TITLE} v{VERSION}\nby {COPYRIGHT}\nCopyright 2023\n\n{DESCRIPTION}\n\n"
+              f"Project Home Page:\n{PROJECT_URL}\n\nPatreon:\n{DONATE_URL}")
+
 
 # Define some stateless helper functions used throught the program
 def get_size_for_fit_frame(content_size, frame_size):
@@ -231,19 +309,25 @@ def fit_to_frame(
     # Actually scale the content
     resized_content = image.resize(content_size, scaling)
 
-    # Make a black image
+    # Make a black image (opaque content only needs an RGB one)
     if transparent:
         resized = Image.new(
             mode="RGBA",
             size=frame_size,
             color=(0, 0, 0, 0)
         )
-    else:
+    elif image.mode == "RGBA":
         resized = Image.new(
             mode="RGBA",
             size=frame_size,
             color=(0, 0, 0, 255)
         )
+    else:
+        resized = Image.new(
+            mode="RGB",
+            size=frame_size,
+            color=(0, 0, 0)
+        )
 
     # Paste the content onto the background
     if fit_settings["limit_width"]:
@@ -252,11 +336,33 @@ def fit_to_frame(
     else:
         paste_x = round((frame_width - content_width) / 2)
         paste_y = 0
-    resized.paste(resized_content, (paste_x, paste_y), resized_content)
+    if resized_content.mode == "RGBA":
+        resized.paste(resized_content, (paste_x, paste_y), resized_content)
+    else:
+        resized.paste(resized_content, (paste_x, paste_y))
 
     return resized
 
 
+def make_label_pair(text, value):
+    label = QLabel(text)
+    label.setAlignment(ALIGN_RIGHT)
+
+    value_label = QLabel(value)
+    value_label.setAlignment(ALIGN_LEFT)
+
+    return label, value_label
+
+
+# Add (label, entry) pairs as rows of a 2-column grid layout, returning the next free row
+def add_form_rows(layout, rows):
+    for row, (label, entry) in enumerate(rows):
+        layout.addWidget(label, row, 0)
+        layout.addWidget(entry, row, 1)
+
+    return len(rows)
+
+
 # Binary Waterfall abstraction class
 #   Provides an abstract object for converting binary files
 #   into audio files and image frames. This object does not
@@ -275,7 +381,17 @@ class BinaryWaterfall:
                  ):
         self.temp_dir = tempfile.mkdtemp()
 
+        # How many audio frames to write at a time
+        self.audio_chunk_frames = 1 << 20
+
         self.audio_filename = None  # Pre-init this to make sure delete_audio works
+        self.audio_length_ms = None  # Pre-init this to make sure set_address_scale works
+        self.sample_bytes = None  # Pre-init these so set_audio_settings can tell what changed
+        self.volume = None
+
+        # Parsed color format strings, the settings dialog checks the same ones over and over
+        self.color_format_cache = dict()
+
         self.set_filename(filename=filename)
 
         self.set_dims(
@@ -299,10 +415,14 @@ class BinaryWaterfall:
         # Delete current audio file if it exists
         self.delete_audio()
 
+        # The frame buffer no longer holds a frame of this file
+        self.frame_qimage_key = None
+
         if filename is None:
             # Reset all vars
             self.filename = None
             self.bytes = None
+            self.bytes_array = None
             self.total_bytes = None
             self.audio_filename = None
             return
@@ -312,9 +432,16 @@ class BinaryWaterfall:
 
         self.filename = os.path.realpath(filename)
 
-        # Load bytes
+        # Map the file into memory, so only the parts that are used get read from disk
+        #   The map stays open after the file is closed, until nothing refers to it anymore
         with open(self.filename, "rb") as f:
-            self.bytes = f.read()
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files can't be mapped
+                self.bytes = bytes()
+            else:
+                self.bytes = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # Keep a zero-copy view of the bytes for fast frame access
+        self.bytes_array = np.frombuffer(self.bytes, dtype=np.uint8)
         self.total_bytes = len(self.bytes)
 
         # Compute audio file name
@@ -347,18 +474,47 @@ class BinaryWaterfall:
         self.height = height
         self.dim = (self.width, self.height)
 
+        # One pixel buffer and the QImage wrapping it, reused by get_frame_qimage for every frame
+        #   Qt's native 32-bit format scales and converts to a pixmap much faster than 24-bit RGB
+        self.frame_buffer = np.full((self.height, self.width, 4), 0xFF, dtype=np.uint8)
+        self.frame_qimage = QImage(
+            self.frame_buffer.data,
+            self.width,
+            self.height,
+            4 * self.width,
+            QImage.Format.Format_RGB32
+        )
+        # Each pixel is one 0xFFRRGGBB integer, so this is a view of its red, green, and blue bytes
+        if sys.byteorder == "little":
+            self.frame_buffer_rgb = self.frame_buffer[:, :, 2::-1]
+        else:
+            self.frame_buffer_rgb = self.frame_buffer[:, :, 1:]
+        # The (address, flip) of the frame in the buffer, None if it doesn't hold one
+        self.frame_qimage_key = None
+
+        self.set_address_scale()
+
     def parse_color_format(self, color_format_string):
+        # Parsing only depends on the string, so each one is only parsed once
+        if color_format_string not in self.color_format_cache:
+            self.color_format_cache[color_format_string] = self.compute_color_format(color_format_string)
+
+        return self.color_format_cache[color_format_string]
+
+    def compute_color_format(self, color_format_string):
         result = {
             "is_valid": True
         }
 
         color_format_string = color_format_string.strip().lower()
 
-        red_count = color_format_string.count(self.ColorFmtCode.RED.value)
-        green_count = color_format_string.count(self.ColorFmtCode.GREEN.value)
-        blue_count = color_format_string.count(self.ColorFmtCode.BLUE.value)
-        white_count = color_format_string.count(self.ColorFmtCode.WHITE.value)
-        unused_count = color_format_string.count(self.ColorFmtCode.UNUSED.value)
+        # Count every format code in a single pass
+        format_counts = Counter(color_format_string)
+        red_count = format_counts[self.ColorFmtCode.RED.value]
+        green_count = format_counts[self.ColorFmtCode.GREEN.value]
+        blue_count = format_counts[self.ColorFmtCode.BLUE.value]
+        white_count = format_counts[self.ColorFmtCode.WHITE.value]
+        unused_count = format_counts[self.ColorFmtCode.UNUSED.value]
 
         rgb_count = red_count + green_count + blue_count
 
@@ -412,27 +568,17 @@ class BinaryWaterfall:
                                   f"allowed, but {blue_count} were given in format string \"{color_format_string}\"")
                 return result
 
-        color_format_list = list()
-        for c in color_format_string:
-            if c not in self.ColorFmtCode.VALID_OPTIONS.value:
-                result["is_valid"] = False
-                result[
-                    "message"] = (f"Color formatting codes only accept \"{self.ColorFmtCode.RED.value}\" = red, "
-                                  f"\"{self.ColorFmtCode.GREEN.value}\" = green, "
-                                  f"\"{self.ColorFmtCode.BLUE.value}\" = blue, "
-                                  f"\"{self.ColorFmtCode.WHITE.value}\" = white, "
-                                  f"\"{self.ColorFmtCode.UNUSED.value}\" = unused")
-                return result
-            if c == self.ColorFmtCode.RED.value:
-                color_format_list.append(self.ColorFmtCode.RED)
-            elif c == self.ColorFmtCode.GREEN.value:
-                color_format_list.append(self.ColorFmtCode.GREEN)
-            elif c == self.ColorFmtCode.BLUE.value:
-                color_format_list.append(self.ColorFmtCode.BLUE)
-            elif c == self.ColorFmtCode.WHITE.value:
-                color_format_list.append(self.ColorFmtCode.WHITE)
-            elif c == self.ColorFmtCode.UNUSED.value:
-                color_format_list.append(self.ColorFmtCode.UNUSED)
+        if not format_counts.keys() <= set(self.ColorFmtCode.VALID_OPTIONS.value):
+            result["is_valid"] = False
+            result[
+                "message"] = (f"Color formatting codes only accept \"{self.ColorFmtCode.RED.value}\" = red, "
+                              f"\"{self.ColorFmtCode.GREEN.value}\" = green, "
+                              f"\"{self.ColorFmtCode.BLUE.value}\" = blue, "
+                              f"\"{self.ColorFmtCode.WHITE.value}\" = white, "
+                              f"\"{self.ColorFmtCode.UNUSED.value}\" = unused")
+            return result
+
+        color_format_list = [self.ColorFmtCode(c) for c in color_format_string]
 
         result["used_color_bytes"] = rgb_count + white_count
         result["unused_color_bytes"] = unused_count
@@ -453,10 +599,28 @@ class BinaryWaterfall:
         self.color_bytes = parsed_string["color_bytes"]
         self.color_format = parsed_string["color_format"]
 
+        # The frame in the buffer was built with the old format
+        self.frame_qimage_key = None
+
+        # Find which byte of each pixel feeds the red, green, and blue channels
+        self.channel_offsets = [None, None, None]
+        for offset, c in enumerate(self.color_format):
+            if c == self.ColorFmtCode.RED:
+                self.channel_offsets[0] = offset
+            elif c == self.ColorFmtCode.GREEN:
+                self.channel_offsets[1] = offset
+            elif c == self.ColorFmtCode.BLUE:
+                self.channel_offsets[2] = offset
+            elif c == self.ColorFmtCode.WHITE:
+                self.channel_offsets = [offset, offset, offset]
+
+        # With the "rgb" format, the file bytes already are the frame's pixels
+        self.is_plain_rgb = self.color_bytes == 3 and self.channel_offsets == [0, 1, 2]
+
+        self.set_address_scale()
+
     def get_color_format_string(self):
-        color_format_string = ""
-        for x in self.color_format:
-            color_format_string += x.value
+        color_format_string = "".join([x.value for x in self.color_format])
 
         return color_format_string
 
@@ -481,16 +645,23 @@ class BinaryWaterfall:
         if volume < 0 or volume > 100:
             raise ValueError("Volume must be between 0 and 100")
 
+        # The samples only depend on the sample size and volume, if those are the same only the header changes
+        header_only = (self.filename is not None and os.path.isfile(self.audio_filename)
+                       and sample_bytes == self.sample_bytes and volume == self.volume)
+
         self.num_channels = num_channels
         self.sample_bytes = sample_bytes
         self.sample_rate = sample_rate
         self.volume = volume
 
-        # Re-compute audio file
-        self.compute_audio()
+        if header_only:
+            self.rewrite_audio_header()
+        else:
+            # Re-compute audio file
+            self.compute_audio()
 
     def delete_audio(self):
-        if self.audio_filename == None:
+        if self.audio_filename is None:
             # Do nothing
             return
         try:
@@ -499,13 +670,14 @@ class BinaryWaterfall:
             pass
 
     def get_audio_length(self):
-        audio_length = pydub.AudioSegment.from_file(self.audio_filename).duration_seconds
-        audio_length_ms = math.ceil(audio_length * 1000)
+        # Computed the same way the WAV header does, so the file never has to be re-opened
+        frame_count = self.total_bytes // (self.num_channels * self.sample_bytes)
+        audio_length_ms = math.ceil((frame_count / self.sample_rate) * 1000)
 
         return audio_length_ms
 
     def compute_audio(self):
-        if self.filename == None:
+        if self.filename is None:
             # If there is no file set, reset the vars
             self.audio_length_ms = None
             return
@@ -513,94 +685,176 @@ class BinaryWaterfall:
         # Delete current file if it exists
         self.delete_audio()
 
-        # Compute the new file (full volume)
+        # Write the audio in chunks of whole frames, so the whole file never has to be in memory at once
+        chunk_length = self.audio_chunk_frames * self.num_channels * self.sample_bytes
+
+        # Compute the new file
         with wave.open(self.audio_filename, "wb") as f:
             f.setnchannels(self.num_channels)
             f.setsampwidth(self.sample_bytes)
             f.setframerate(self.sample_rate)
-            f.writeframesraw(self.bytes)
-
-        if self.volume != 100:
-            # Reduce the audio volume
-            factor = self.volume / 100
-            audio = pydub.AudioSegment.from_file(file=self.audio_filename, format="wav")
-            audio += pydub.audio_segment.ratio_to_db(factor)
-            temp_filename = self.audio_filename + ".temp"
-            audio.export(temp_filename, format="wav")
-            self.delete_audio()
-            shutil.move(temp_filename, self.audio_filename)
-
-        # Get audio length
+
+            for chunk_start in range(0, self.total_bytes, chunk_length):
+                audio_bytes = self.bytes_array[chunk_start:chunk_start + chunk_length]
+
+                if self.volume != 100:
+                    # Reduce the audio volume
+                    audio_bytes = self.scale_volume(audio_bytes)
+
+                f.writeframesraw(audio_bytes)
+
         self.audio_length_ms = self.get_audio_length()
 
+        self.set_address_scale()
+
+    # Update the format fields of the WAV header in place, leaving the samples as they are
+    def rewrite_audio_header(self):
+        block_align = self.num_channels * self.sample_bytes
+
+        with open(self.audio_filename, "r+b") as f:
+            # The channels, sample rate, byte rate, and block align follow the format tag in a PCM WAV header
+            f.seek(22)
+            f.write(struct.pack(
+                "<HIIH",
+                self.num_channels,
+                self.sample_rate,
+                self.sample_rate * block_align,
+                block_align
+            ))
+
+        self.audio_length_ms = self.get_audio_length()
+
+        self.set_address_scale()
+
+    def scale_volume(self, audio_bytes):
+        # Only whole samples are scaled, any leftover bytes are kept as-is
+        sample_count = audio_bytes.size // self.sample_bytes
+        sample_length = sample_count * self.sample_bytes
+        sample_bytes = audio_bytes[:sample_length]
+
+        # Scaling a sample by up to 100 only overflows 32 bits for 32-bit samples
+        if self.sample_bytes == 4:
+            math_type = np.int64
+        else:
+            math_type = np.int32
+
+        # Convert the raw bytes to signed samples
+        if self.sample_bytes == 1:
+            # 8-bit WAV samples are unsigned
+            samples = sample_bytes.astype(math_type)
+            samples -= 128
+        elif self.sample_bytes == 3:
+            # Widen 24-bit samples to 32-bit, the shift keeps the sign
+            widened = np.zeros((sample_count, 4), dtype=np.uint8)
+            widened[:, 1:] = sample_bytes.reshape(sample_count, 3)
+            samples = widened.view("<i4").reshape(sample_count) >> 8
+        else:
+            samples = sample_bytes.view(f"<i{self.sample_bytes}").astype(math_type)
+
+        # Scale in place, to avoid any more full-size copies
+        np.multiply(samples, self.volume, out=samples)
+        np.floor_divide(samples, 100, out=samples)
+
+        # Convert the samples back to raw bytes
+        if self.sample_bytes == 1:
+            scaled_bytes = (samples + 128).astype(np.uint8)
+        elif self.sample_bytes == 3:
+            widened = (samples << 8).astype("<i4").view(np.uint8).reshape(sample_count, 4)
+            scaled_bytes = widened[:, 1:].reshape(sample_length)
+        else:
+            scaled_bytes = samples.astype(f"<i{self.sample_bytes}").view(np.uint8)
+
+        return np.concatenate((scaled_bytes, audio_bytes[sample_length:]))
+
     def change_filename(self, new_filename):
         self.set_filename(new_filename)
         self.compute_audio()
 
+    def set_address_scale(self):
+        if self.audio_length_ms is None:
+            # Nothing to address yet
+            return
+
+        # These only change with the file or the settings, so compute them once
+        self.address_block_size = self.width * self.color_bytes
+        if self.audio_length_ms == 0:
+            # Files too short to make any audio only have the first frame
+            self.blocks_per_ms = 0
+        else:
+            total_blocks = math.ceil(self.total_bytes / self.address_block_size)
+            self.blocks_per_ms = total_blocks / self.audio_length_ms
+
     def get_address(self, ms):
-        address_block_size = self.width * self.color_bytes
-        total_blocks = math.ceil(self.total_bytes / address_block_size)
-        address_block_offset = round(ms * total_blocks / self.audio_length_ms)
-        return address_block_offset * address_block_size
+        address_block_offset = round(ms * self.blocks_per_ms)
+        return address_block_offset * self.address_block_size
 
-    # A 1D Python byte string
-    def get_frame_bytestring(self, ms):
-        picture_bytes = bytes()
+    # A NumPy array of an RGB frame (row, column, channel)
+    #   If out is given, the frame is written into it instead of a new array
+    def get_frame_array(self, ms, flip=True, out=None):
+        frame_length = self.width * self.height * self.color_bytes
         current_address = self.get_address(ms)
-        for row in range(self.height):
-            for col in range(self.width):
-                # Fill one BGR byte value
-                this_byte = [b'\x00', b'\x00', b'\x00']
-                for c in self.color_format:
-                    if c == self.ColorFmtCode.RED:
-                        this_byte[0] = self.bytes[current_address:current_address + 1]  # Red
-                    elif c == self.ColorFmtCode.GREEN:
-                        this_byte[1] = self.bytes[current_address:current_address + 1]  # Green
-                    elif c == self.ColorFmtCode.BLUE:
-                        this_byte[2] = self.bytes[current_address:current_address + 1]  # Blue
-                    elif c == self.ColorFmtCode.WHITE:
-                        this_byte[0] = self.bytes[current_address:current_address + 1]  # Red
-                        this_byte[1] = self.bytes[current_address:current_address + 1]  # Green
-                        this_byte[2] = self.bytes[current_address:current_address + 1]  # Blue
-
-                    current_address += 1
-
-                picture_bytes += b"".join(this_byte)
-
-        full_length = (self.width * self.height * 3)
-        picture_bytes_length = len(picture_bytes)
-        # Pad picture data if we're near the end of the file
-        if picture_bytes_length < full_length:
-            pad_length = full_length - picture_bytes_length
-            picture_bytes += b"\x00" * pad_length
-
-        return picture_bytes
 
-    # A PIL Image (RGB)
-    def get_frame_image(self, ms, flip=True):
-        frame_bytesring = self.get_frame_bytestring(ms)
-        img = Image.frombytes("RGB", (self.width, self.height), frame_bytesring)
+        frame_block = self.bytes_array[current_address:current_address + frame_length]
+
+        # If we're near the end of the file, the missing pixels are black
+        if frame_block.size < frame_length:
+            frame_block = np.pad(frame_block, (0, frame_length - frame_block.size))
+        frame_block = frame_block.reshape(self.height, self.width, self.color_bytes)
 
         if flip:
-            img = ImageOps.flip(img)
+            # Flip vertically (just a view, the gather below writes the rows in flipped order)
+            frame_block = frame_block[::-1]
+
+        if out is None:
+            out = np.empty((self.height, self.width, 3), dtype=np.uint8)
+
+        if self.is_plain_rgb and out.flags.c_contiguous:
+            # Copy whole rows at once, much faster than copying each channel
+            np.copyto(out, frame_block)
+            return out
+
+        # Copy each RGB channel from its position in the color format, straight into the output
+        for channel, offset in enumerate(self.channel_offsets):
+            if offset is None:
+                out[:, :, channel] = 0
+            else:
+                out[:, :, channel] = frame_block[:, :, offset]
+
+        return out
+
+    # A 1D Python byte string
+    def get_frame_bytestring(self, ms, flip=False):
+        return self.get_frame_array(ms, flip=flip).tobytes()
+
+    # A NumPy array of many RGB frames (frame, row, column, channel)
+    def get_frames_array(self, ms_list, flip=True):
+        frames = np.empty((len(ms_list), self.height, self.width, 3), dtype=np.uint8)
+
+        # Copy each frame straight out of the memory map, instead of indexing every byte of every frame at once
+        for frame, ms in zip(frames, ms_list):
+            self.get_frame_array(ms, flip=flip, out=frame)
+
+        return frames
+
+    # A PIL Image (RGB)
+    def get_frame_image(self, ms, flip=True):
+        img = Image.fromarray(self.get_frame_array(ms, flip=flip), "RGB")
 
         return img
 
     # A QImage (RGB)
+    #   The same QImage is reused for every frame, so it is only valid until the next call
     def get_frame_qimage(self, ms, flip=True):
-        frame_bytesring = self.get_frame_bytestring(ms)
-        qimg = QImage(
-            frame_bytesring,
-            self.width,
-            self.height,
-            3 * self.width,
-            QImage.Format.Format_RGB888
-        )
-        if flip:
-            # Flip vertically
-            qimg = qimg.mirrored(horizontal=False, vertical=True)
+        # Nearby timestamps often map to the same address, and so the same frame
+        frame_key = (self.get_address(ms), flip)
+        if frame_key == self.frame_qimage_key:
+            return self.frame_qimage
+
+        # The array is already flipped, so Qt doesn't need to mirror it
+        self.get_frame_array(ms, flip=flip, out=self.frame_buffer_rgb)
+        self.frame_qimage_key = frame_key
 
-        return qimg
+        return self.frame_qimage
 
     def cleanup(self):
         self.delete_audio()
@@ -613,55 +867,40 @@ class Watermarker:
     def __init__(self):
         self.img = Image.open(ICON_PATH["watermark"]).convert("RGBA")
 
+        # Scaled watermarks and where they go, by frame size
+        self.marks = dict()
+
+    def get_mark(self, size):
+        # Only scale the watermark once for each frame size
+        if size not in self.marks:
+            scaled_mark = fit_to_frame(
+                image=self.img,
+                frame_size=size,
+                scaling=Image.BICUBIC,
+                transparent=True
+            )
+
+            # Crop off the fully transparent border, pasting it would leave the pixels unchanged anyway
+            visible_box = scaled_mark.getchannel("A").getbbox()
+            if visible_box is None:
+                self.marks[size] = (None, None)
+            else:
+                self.marks[size] = (scaled_mark.crop(visible_box), visible_box[:2])
+
+        return self.marks[size]
+
     def mark(self, image):
-        this_mark = self.img.copy()
-        this_mark = fit_to_frame(
-            image=this_mark,
-            frame_size=image.size,
-            scaling=Image.BICUBIC,
-            transparent=True
-        )
+        this_mark, mark_position = self.get_mark(image.size)
 
         output_image = image.copy()
-        output_image.paste(this_mark, (0, 0), this_mark)
+        if this_mark is not None:
+            output_image.paste(this_mark, mark_position, this_mark)
 
         return output_image
 
 
-# Custom proglog class for QProgressDialogs
-#   Handles updating the progress in a QProgressDialog
-#   Designed to work with moviepy's export option
-class QtBarLoggerMoviepy(ProgressBarLogger):
-    def set_progress_dialog(self, progress_dialog, start_progress=0):
-        self.progress_dialog = progress_dialog
-        progress_dialog.setMaximum(100)
-        self.set_progress(start_progress)
-
-    def set_progress(self, value):
-        self.progress_dialog.setValue(value)
-
-    def callback(self, **changes):
-        if "message" in changes:
-            message = changes["message"].strip("Moviepy - ")
-
-            if "Building video" in message:
-                self.progress_dialog.setLabelText("(1/3) Building video...")
-            elif "Writing audio" in message:
-                self.progress_dialog.setLabelText("(2/3) Writing audio...")
-            elif "Done." in message:
-                self.progress_dialog.setLabelText("Done writing audio!")
-            elif "Writing video" in message:
-                self.progress_dialog.setLabelText("(3/3) Writing video...")
-            elif "Done !" in message:
-                self.progress_dialog.setLabelText("Done writing video!")
-            elif "video ready" in message:
-                self.progress_dialog.setLabelText("Video is ready!")
-            else:
-                self.progress_dialog.setLabelText(message)
-
-    def bars_callback(self, bar, attr, value, old_value=None):
-        percent = (value / self.bars[bar]["total"]) * 100
-        self.set_progress(round(percent))
+# One watermarker for the whole program, so the scaled watermarks are shared
+WATERMARKER = Watermarker()
 
 
 # Audio settings input window
@@ -676,7 +915,7 @@ class AudioSettings(QDialog):
                  ):
         super().__init__(parent=parent)
         self.setWindowTitle("Audio Settings")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
+        self.setWindowIcon(get_icon(ICON_PATH["program"]))
 
         # Hide "?" button
         self.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
@@ -687,33 +926,21 @@ class AudioSettings(QDialog):
         self.volume = volume
 
         self.channels_label = QLabel("Channels:")
-        self.channels_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.channels_label.setAlignment(ALIGN_RIGHT)
 
         self.channels_entry = QComboBox()
         self.channels_entry.addItems(["1 (mono)", "2 (stereo)"])
-        if self.num_channels == 1:
-            self.channels_entry.setCurrentIndex(0)
-        elif self.num_channels == 2:
-            self.channels_entry.setCurrentIndex(1)
-        self.channels_entry.currentIndexChanged.connect(self.channel_entry_changed)
+        self.channels_entry.setCurrentIndex(self.num_channels - 1)
 
         self.sample_size_label = QLabel("Sample Size:")
-        self.sample_size_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.sample_size_label.setAlignment(ALIGN_RIGHT)
 
         self.sample_size_entry = QComboBox()
         self.sample_size_entry.addItems(["8-bit", "16-bit", "24-bit", "32-bit"])
-        if self.sample_bytes == 1:
-            self.sample_size_entry.setCurrentIndex(0)
-        elif self.sample_bytes == 2:
-            self.sample_size_entry.setCurrentIndex(1)
-        elif self.sample_bytes == 3:
-            self.sample_size_entry.setCurrentIndex(2)
-        elif self.sample_bytes == 4:
-            self.sample_size_entry.setCurrentIndex(3)
-        self.sample_size_entry.currentIndexChanged.connect(self.sample_size_entry_changed)
+        self.sample_size_entry.setCurrentIndex(self.sample_bytes - 1)
 
         self.sample_rate_label = QLabel("Sample Rate:")
-        self.sample_rate_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.sample_rate_label.setAlignment(ALIGN_RIGHT)
 
         self.sample_rate_entry = QSpinBox()
         self.sample_rate_entry.setMinimum(1)
@@ -721,10 +948,9 @@ class AudioSettings(QDialog):
         self.sample_rate_entry.setSingleStep(1000)
         self.sample_rate_entry.setSuffix("Hz")
         self.sample_rate_entry.setValue(self.sample_rate)
-        self.sample_rate_entry.valueChanged.connect(self.sample_rate_entry_changed)
 
         self.volume_label = QLabel("File Volume:")
-        self.volume_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.volume_label.setAlignment(ALIGN_RIGHT)
 
         self.volume_entry = QSpinBox()
         self.volume_entry.setMinimum(0)
@@ -732,7 +958,6 @@ class AudioSettings(QDialog):
         self.volume_entry.setSingleStep(5)
         self.volume_entry.setSuffix("%")
         self.volume_entry.setValue(self.volume)
-        self.volume_entry.valueChanged.connect(self.volume_entry_changed)
 
         self.confirm_buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         self.confirm_buttons.accepted.connect(self.accept)
@@ -740,15 +965,13 @@ class AudioSettings(QDialog):
 
         self.main_layout = QGridLayout()
 
-        self.main_layout.addWidget(self.channels_label, 0, 0)
-        self.main_layout.addWidget(self.channels_entry, 0, 1)
-        self.main_layout.addWidget(self.sample_size_label, 1, 0)
-        self.main_layout.addWidget(self.sample_size_entry, 1, 1)
-        self.main_layout.addWidget(self.sample_rate_label, 2, 0)
-        self.main_layout.addWidget(self.sample_rate_entry, 2, 1)
-        self.main_layout.addWidget(self.volume_label, 3, 0)
-        self.main_layout.addWidget(self.volume_entry, 3, 1)
-        self.main_layout.addWidget(self.confirm_buttons, 4, 0, 1, 2)
+        next_row = add_form_rows(self.main_layout, [
+            (self.channels_label, self.channels_entry),
+            (self.sample_size_label, self.sample_size_entry),
+            (self.sample_rate_label, self.sample_rate_entry),
+            (self.volume_label, self.volume_entry)
+        ])
+        self.main_layout.addWidget(self.confirm_buttons, next_row, 0, 1, 2)
 
         self.setLayout(self.main_layout)
 
@@ -756,34 +979,29 @@ class AudioSettings(QDialog):
 
     def get_audio_settings(self):
         result = dict()
-        result["num_channels"] = self.num_channels
-        result["sample_bytes"] = self.sample_bytes
-        result["sample_rate"] = self.sample_rate
-        result["volume"] = self.volume
+        result["num_channels"] = self.channels_entry.currentIndex() + 1
+        result["sample_bytes"] = self.sample_size_entry.currentIndex() + 1
+        result["sample_rate"] = self.sample_rate_entry.value()
+        result["volume"] = self.volume_entry.value()
 
         return result
 
-    def channel_entry_changed(self, idx):
-        if idx == 0:
-            self.num_channels = 1
-        elif idx == 1:
-            self.num_channels = 2
-
-    def sample_size_entry_changed(self, idx):
-        if idx == 0:
-            self.sample_bytes = 1
-        elif idx == 1:
-            self.sample_bytes = 2
-        elif idx == 2:
-            self.sample_bytes = 3
-        elif idx == 3:
-            self.sample_bytes = 4
-
-    def sample_rate_entry_changed(self, value):
-        self.sample_rate = value
+    # Reset the entries, so the dialog can be shown again without rebuilding it
+    def reload(self,
+               num_channels,
+               sample_bytes,
+               sample_rate,
+               volume
+               ):
+        self.num_channels = num_channels
+        self.sample_bytes = sample_bytes
+        self.sample_rate = sample_rate
+        self.volume = volume
 
-    def volume_entry_changed(self, value):
-        self.volume = value
+        self.channels_entry.setCurrentIndex(self.num_channels - 1)
+        self.sample_size_entry.setCurrentIndex(self.sample_bytes - 1)
+        self.sample_rate_entry.setValue(self.sample_rate)
+        self.volume_entry.setValue(self.volume)
 
     def resize_window(self):
         self.setFixedSize(self.sizeHint())
@@ -801,7 +1019,7 @@ class VideoSettings(QDialog):
                  ):
         super().__init__(parent=parent)
         self.setWindowTitle("Video Settings")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
+        self.setWindowIcon(get_icon(ICON_PATH["program"]))
 
         # Hide "?" button
         self.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
@@ -811,9 +1029,10 @@ class VideoSettings(QDialog):
         self.width = width
         self.height = height
         self.color_format = color_format
+        self.color_format_error = None
 
         self.width_label = QLabel("Width:")
-        self.width_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.width_label.setAlignment(ALIGN_RIGHT)
 
         self.width_entry = QSpinBox()
         self.width_entry.setMinimum(4)
@@ -821,10 +1040,9 @@ class VideoSettings(QDialog):
         self.width_entry.setSingleStep(4)
         self.width_entry.setSuffix("px")
         self.width_entry.setValue(self.width)
-        self.width_entry.valueChanged.connect(self.width_entry_changed)
 
         self.height_label = QLabel("Height:")
-        self.height_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.height_label.setAlignment(ALIGN_RIGHT)
 
         self.height_entry = QSpinBox()
         self.height_entry.setMinimum(4)
@@ -832,10 +1050,9 @@ class VideoSettings(QDialog):
         self.height_entry.setSingleStep(4)
         self.height_entry.setSuffix("px")
         self.height_entry.setValue(self.height)
-        self.height_entry.valueChanged.connect(self.height_entry_changed)
 
         self.color_format_label = QLabel("Color Format:")
-        self.color_format_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.color_format_label.setAlignment(ALIGN_RIGHT)
 
         self.color_format_entry = QLineEdit()
         self.color_format_entry.setMaxLength(64)
@@ -848,13 +1065,12 @@ class VideoSettings(QDialog):
 
         self.main_layout = QGridLayout()
 
-        self.main_layout.addWidget(self.width_label, 0, 0)
-        self.main_layout.addWidget(self.width_entry, 0, 1)
-        self.main_layout.addWidget(self.height_label, 1, 0)
-        self.main_layout.addWidget(self.height_entry, 1, 1)
-        self.main_layout.addWidget(self.color_format_label, 2, 0)
-        self.main_layout.addWidget(self.color_format_entry, 2, 1)
-        self.main_layout.addWidget(self.confirm_buttons, 3, 0, 1, 2)
+        next_row = add_form_rows(self.main_layout, [
+            (self.width_label, self.width_entry),
+            (self.height_label, self.height_entry),
+            (self.color_format_label, self.color_format_entry)
+        ])
+        self.main_layout.addWidget(self.confirm_buttons, next_row, 0, 1, 2)
 
         self.setLayout(self.main_layout)
 
@@ -862,33 +1078,70 @@ class VideoSettings(QDialog):
 
     def get_video_settings(self):
         result = dict()
-        result["width"] = self.width
-        result["height"] = self.height
+        result["width"] = self.width_entry.value()
+        result["height"] = self.height_entry.value()
         result["color_format"] = self.color_format
 
         return result
 
-    def width_entry_changed(self, value):
-        self.width = value
+    # Reset the entries, so the dialog can be shown again without rebuilding it
+    def reload(self,
+               bw,
+               width,
+               height,
+               color_format
+               ):
+        self.bw = bw
 
-    def height_entry_changed(self, value):
-        self.height = value
+        self.width = width
+        self.height = height
+        self.color_format = color_format
+
+        self.width_entry.setValue(self.width)
+        self.height_entry.setValue(self.height)
+        self.color_format_entry.setText(self.color_format)
+        self.set_color_format_error(None)
 
     def color_format_entry_changed(self):
         color_format = self.color_format_entry.text()
+        if color_format == self.color_format:
+            # Focus changes without an edit, skip re-parsing the same format
+            self.set_color_format_error(None)
+            return
+
         parsed = self.bw.parse_color_format(color_format)
         if parsed["is_valid"]:
             self.color_format = color_format
+            self.set_color_format_error(None)
+        else:
+            # Flag the entry inline, the popup is only shown on OK
+            self.set_color_format_error(parsed["message"])
+
+    def set_color_format_error(self, message):
+        self.color_format_error = message
+
+        if message is None:
+            self.color_format_entry.setStyleSheet("")
+            self.color_format_entry.setToolTip("")
         else:
-            self.color_format_entry.setText(self.color_format)
+            self.color_format_entry.setStyleSheet("border: 1px solid red")
+            self.color_format_entry.setToolTip(message)
+
+    def accept(self):
+        self.color_format_entry_changed()
+
+        if self.color_format_error is not None:
             self.color_format_entry.setFocus()
 
             error_popup = QMessageBox(parent=self)
             error_popup.setIcon(QMessageBox.Critical)
             error_popup.setText("Invalid Color Format")
-            error_popup.setInformativeText(parsed["message"])
+            error_popup.setInformativeText(self.color_format_error)
             error_popup.setWindowTitle("Error")
             error_popup.exec()
+            return
+
+        super().accept()
 
     def resize_window(self):
         self.setFixedSize(self.sizeHint())
@@ -904,7 +1157,7 @@ class PlayerSettings(QDialog):
                  ):
         super().__init__(parent=parent)
         self.setWindowTitle("Player Settings")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
+        self.setWindowIcon(get_icon(ICON_PATH["program"]))
 
         # Hide "?" button
         self.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
@@ -913,7 +1166,7 @@ class PlayerSettings(QDialog):
         self.fps = fps
 
         self.max_dim_label = QLabel("Max. Dimension:")
-        self.max_dim_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.max_dim_label.setAlignment(ALIGN_RIGHT)
 
         self.max_dim_entry = QSpinBox()
         self.max_dim_entry.setMinimum(256)
@@ -921,10 +1174,9 @@ class PlayerSettings(QDialog):
         self.max_dim_entry.setSingleStep(64)
         self.max_dim_entry.setSuffix("px")
         self.max_dim_entry.setValue(self.max_view_dim)
-        self.max_dim_entry.valueChanged.connect(self.max_dim_entry_changed)
 
         self.fps_label = QLabel("Framerate:")
-        self.fps_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.fps_label.setAlignment(ALIGN_RIGHT)
 
         self.fps_entry = QSpinBox()
         self.fps_entry.setMinimum(1)
@@ -932,7 +1184,6 @@ class PlayerSettings(QDialog):
         self.fps_entry.setSingleStep(1)
         self.fps_entry.setSuffix("fps")
         self.fps_entry.setValue(self.fps)
-        self.fps_entry.valueChanged.connect(self.fps_entry_changed)
 
         self.confirm_buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         self.confirm_buttons.accepted.connect(self.accept)
@@ -940,11 +1191,11 @@ class PlayerSettings(QDialog):
 
         self.main_layout = QGridLayout()
 
-        self.main_layout.addWidget(self.max_dim_label, 0, 0)
-        self.main_layout.addWidget(self.max_dim_entry, 0, 1)
-        self.main_layout.addWidget(self.fps_label, 1, 0)
-        self.main_layout.addWidget(self.fps_entry, 1, 1)
-        self.main_layout.addWidget(self.confirm_buttons, 2, 0, 1, 2)
+        next_row = add_form_rows(self.main_layout, [
+            (self.max_dim_label, self.max_dim_entry),
+            (self.fps_label, self.fps_entry)
+        ])
+        self.main_layout.addWidget(self.confirm_buttons, next_row, 0, 1, 2)
 
         self.setLayout(self.main_layout)
 
@@ -952,145 +1203,67 @@ class PlayerSettings(QDialog):
 
     def get_player_settings(self):
         result = dict()
-        result["max_view_dim"] = self.max_view_dim
-        result["fps"] = self.fps
+        result["max_view_dim"] = self.max_dim_entry.value()
+        result["fps"] = self.fps_entry.value()
 
         return result
 
-    def max_dim_entry_changed(self, value):
-        self.max_view_dim = value
+    # Reset the entries, so the dialog can be shown again without rebuilding it
+    def reload(self,
+               max_view_dim,
+               fps
+               ):
+        self.max_view_dim = max_view_dim
+        self.fps = fps
 
-    def fps_entry_changed(self, value):
-        self.fps = value
+        self.max_dim_entry.setValue(self.max_view_dim)
+        self.fps_entry.setValue(self.fps)
 
     def resize_window(self):
         self.setFixedSize(self.sizeHint())
 
 
-# Export image dialog
-#   User interface to export a single frame
-class ExportFrame(QDialog):
+# Export dialog base class
+#   Builds the size, aspect ratio and optional framerate entries
+#   shared by all of the export dialogs
+class ExportDialog(QDialog):
     def __init__(self,
+                 title,
                  width,
                  height,
+                 fps=None,
                  parent=None
                  ):
         super().__init__(parent=parent)
-        self.setWindowTitle("Export Image")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
+        self.setWindowTitle(title)
+        self.setWindowIcon(get_icon(ICON_PATH["program"]))
 
         # Hide "?" button
         self.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
 
         self.width = width
         self.height = height
+        self.fps = fps
         self.keep_aspect = False
 
-        self.width_label = QLabel("Export Width:")
-        self.width_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.width_entry = QSpinBox()
-        self.width_entry.setMinimum(64)
-        self.width_entry.setMaximum(7680)
-        self.width_entry.setSingleStep(64)
-        self.width_entry.setSuffix("px")
-        self.width_entry.setValue(self.width)
-        self.width_entry.valueChanged.connect(self.width_entry_changed)
-
-        self.height_label = QLabel("Export Height:")
-        self.height_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.height_entry = QSpinBox()
-        self.height_entry.setMinimum(64)
-        self.height_entry.setMaximum(7680)
-        self.height_entry.setSingleStep(64)
-        self.height_entry.setSuffix("px")
-        self.height_entry.setValue(self.height)
-        self.height_entry.valueChanged.connect(self.height_entry_changed)
-
-        self.aspect_label = QLabel("Aspect Ratio:")
-        self.aspect_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.aspect_entry = QCheckBox("Force")
-        self.aspect_entry.setChecked(self.keep_aspect)
-        self.aspect_entry.stateChanged.connect(self.aspect_entry_changed)
-
-        self.confirm_buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        self.confirm_buttons.accepted.connect(self.accept)
-        self.confirm_buttons.rejected.connect(self.reject)
-
-        self.main_layout = QGridLayout()
-
-        self.main_layout.addWidget(self.width_label, 0, 0)
-        self.main_layout.addWidget(self.width_entry, 0, 1)
-        self.main_layout.addWidget(self.height_label, 1, 0)
-        self.main_layout.addWidget(self.height_entry, 1, 1)
-        self.main_layout.addWidget(self.aspect_label, 2, 0)
-        self.main_layout.addWidget(self.aspect_entry, 2, 1)
-        self.main_layout.addWidget(self.confirm_buttons, 3, 0, 1, 2)
-
-        self.setLayout(self.main_layout)
-
-        self.resize_window()
-
-    def resize_window(self):
-        self.setFixedSize(self.sizeHint())
-
-    def get_settings(self):
-        result = dict()
-        result["width"] = self.width
-        result["height"] = self.height
-        result["keep_aspect"] = self.keep_aspect
-
-        return result
-
-    def width_entry_changed(self, value):
-        self.width = value
+        # Rows of (label, entry) to lay out, subclasses may append more before calling finish_layout
+        self.form_rows = []
 
-    def height_entry_changed(self, value):
-        self.height = value
+        if self.fps is not None:
+            self.fps_label = QLabel("FPS:")
+            self.fps_label.setAlignment(ALIGN_RIGHT)
 
-    def aspect_entry_changed(self, value):
-        if value == 0:
-            self.keep_aspect = False
-        else:
-            self.keep_aspect = True
-
-
-# Export image sequence dialog
-#   User interface to export an image sequence
-class ExportSequence(QDialog):
-    def __init__(self,
-                 width,
-                 height,
-                 parent=None
-                 ):
-        super().__init__(parent=parent)
-        self.setWindowTitle("Export Sequence")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
-
-        # Hide "?" button
-        self.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
+            self.fps_entry = QDoubleSpinBox()
+            self.fps_entry.setMinimum(1.0)
+            self.fps_entry.setMaximum(120.0)
+            self.fps_entry.setSingleStep(1.0)
+            self.fps_entry.setSuffix("fps")
+            self.fps_entry.setValue(self.fps)
 
-        self.width = width
-        self.height = height
-        self.fps = 60.0
-        self.keep_aspect = False
-        self.format = Renderer.ImageFormatCode.PNG
-
-        self.fps_label = QLabel("FPS:")
-        self.fps_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.fps_entry = QDoubleSpinBox()
-        self.fps_entry.setMinimum(1.0)
-        self.fps_entry.setMaximum(120.0)
-        self.fps_entry.setSingleStep(1.0)
-        self.fps_entry.setSuffix("fps")
-        self.fps_entry.setValue(self.fps)
-        self.fps_entry.valueChanged.connect(self.fps_entry_changed)
+            self.form_rows.append((self.fps_label, self.fps_entry))
 
         self.width_label = QLabel("Export Width:")
-        self.width_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.width_label.setAlignment(ALIGN_RIGHT)
 
         self.width_entry = QSpinBox()
         self.width_entry.setMinimum(64)
@@ -1098,10 +1271,9 @@ class ExportSequence(QDialog):
         self.width_entry.setSingleStep(64)
         self.width_entry.setSuffix("px")
         self.width_entry.setValue(self.width)
-        self.width_entry.valueChanged.connect(self.width_entry_changed)
 
         self.height_label = QLabel("Export Height:")
-        self.height_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.height_label.setAlignment(ALIGN_RIGHT)
 
         self.height_entry = QSpinBox()
         self.height_entry.setMinimum(64)
@@ -1109,45 +1281,26 @@ class ExportSequence(QDialog):
         self.height_entry.setSingleStep(64)
         self.height_entry.setSuffix("px")
         self.height_entry.setValue(self.height)
-        self.height_entry.valueChanged.connect(self.height_entry_changed)
 
         self.aspect_label = QLabel("Aspect Ratio:")
-        self.aspect_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.aspect_label.setAlignment(ALIGN_RIGHT)
 
         self.aspect_entry = QCheckBox("Force")
         self.aspect_entry.setChecked(self.keep_aspect)
-        self.aspect_entry.stateChanged.connect(self.aspect_entry_changed)
 
-        self.format_label = QLabel("Image Format:")
-        self.format_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.format_entry = QComboBox()
-        self.format_entry.addItems(["PNG (.png)", "JPEG (.jpg)", "BMP (.bmp)"])
-        if self.format == Renderer.ImageFormatCode.PNG:
-            self.format_entry.setCurrentIndex(0)
-        elif self.format == Renderer.ImageFormatCode.JPEG:
-            self.format_entry.setCurrentIndex(1)
-        elif self.format == Renderer.ImageFormatCode.BITMAP:
-            self.format_entry.setCurrentIndex(2)
-        self.format_entry.currentIndexChanged.connect(self.format_entry_changed)
+        self.form_rows.append((self.width_label, self.width_entry))
+        self.form_rows.append((self.height_label, self.height_entry))
+        self.form_rows.append((self.aspect_label, self.aspect_entry))
 
         self.confirm_buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         self.confirm_buttons.accepted.connect(self.accept)
         self.confirm_buttons.rejected.connect(self.reject)
 
+    def finish_layout(self):
         self.main_layout = QGridLayout()
 
-        self.main_layout.addWidget(self.fps_label, 0, 0)
-        self.main_layout.addWidget(self.fps_entry, 0, 1)
-        self.main_layout.addWidget(self.width_label, 1, 0)
-        self.main_layout.addWidget(self.width_entry, 1, 1)
-        self.main_layout.addWidget(self.height_label, 2, 0)
-        self.main_layout.addWidget(self.height_entry, 2, 1)
-        self.main_layout.addWidget(self.aspect_label, 3, 0)
-        self.main_layout.addWidget(self.aspect_entry, 3, 1)
-        self.main_layout.addWidget(self.format_label, 4, 0)
-        self.main_layout.addWidget(self.format_entry, 4, 1)
-        self.main_layout.addWidget(self.confirm_buttons, 5, 0, 1, 2)
+        next_row = add_form_rows(self.main_layout, self.form_rows)
+        self.main_layout.addWidget(self.confirm_buttons, next_row, 0, 1, 2)
 
         self.setLayout(self.main_layout)
 
@@ -1158,144 +1311,119 @@ class ExportSequence(QDialog):
 
     def get_settings(self):
         result = dict()
-        result["width"] = self.width
-        result["height"] = self.height
-        result["fps"] = self.fps
-        result["keep_aspect"] = self.keep_aspect
-        result["format"] = self.format
+        result["width"] = self.width_entry.value()
+        result["height"] = self.height_entry.value()
+        if self.fps is not None:
+            result["fps"] = self.fps_entry.value()
+        result["keep_aspect"] = self.aspect_entry.isChecked()
 
         return result
 
-    def width_entry_changed(self, value):
-        self.width = value
-
-    def height_entry_changed(self, value):
-        self.height = value
-
-    def aspect_entry_changed(self, value):
-        if value == 0:
-            self.keep_aspect = False
-        else:
-            self.keep_aspect = True
-
-    def fps_entry_changed(self, value):
-        self.fps = value
+    # Reset the entries, so the dialog can be shown again without rebuilding it
+    def reload(self,
+               width,
+               height
+               ):
+        self.width = width
+        self.height = height
 
-    def format_entry_changed(self, value):
-        if value == 0:
-            self.format = Renderer.ImageFormatCode.PNG
-        elif value == 1:
-            self.format = Renderer.ImageFormatCode.JPEG
-        elif value == 2:
-            self.format = Renderer.ImageFormatCode.BITMAP
+        self.width_entry.setValue(self.width)
+        self.height_entry.setValue(self.height)
+        if self.fps is not None:
+            self.fps_entry.setValue(self.fps)
+        self.aspect_entry.setChecked(self.keep_aspect)
 
 
-# Export video dialog
-#   User interface to export a video
-class ExportVideo(QDialog):
+# Export image dialog
+#   User interface to export a single frame
+class ExportFrame(ExportDialog):
     def __init__(self,
                  width,
                  height,
                  parent=None
                  ):
-        super().__init__(parent=parent)
-        self.setWindowTitle("Export Video")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
-
-        # Hide "?" button
-        self.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
-
-        self.width = width
-        self.height = height
-        self.fps = 60.0
-        self.keep_aspect = False
-
-        self.fps_label = QLabel("FPS:")
-        self.fps_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.fps_entry = QDoubleSpinBox()
-        self.fps_entry.setMinimum(1.0)
-        self.fps_entry.setMaximum(120.0)
-        self.fps_entry.setSingleStep(1.0)
-        self.fps_entry.setSuffix("fps")
-        self.fps_entry.setValue(self.fps)
-        self.fps_entry.valueChanged.connect(self.fps_entry_changed)
-
-        self.width_label = QLabel("Export Width:")
-        self.width_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.width_entry = QSpinBox()
-        self.width_entry.setMinimum(64)
-        self.width_entry.setMaximum(7680)
-        self.width_entry.setSingleStep(64)
-        self.width_entry.setSuffix("px")
-        self.width_entry.setValue(self.width)
-        self.width_entry.valueChanged.connect(self.width_entry_changed)
-
-        self.height_label = QLabel("Export Height:")
-        self.height_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        super().__init__(
+            title="Export Image",
+            width=width,
+            height=height,
+            parent=parent
+        )
 
-        self.height_entry = QSpinBox()
-        self.height_entry.setMinimum(64)
-        self.height_entry.setMaximum(7680)
-        self.height_entry.setSingleStep(64)
-        self.height_entry.setSuffix("px")
-        self.height_entry.setValue(self.height)
-        self.height_entry.valueChanged.connect(self.height_entry_changed)
+        self.finish_layout()
 
-        self.aspect_label = QLabel("Aspect Ratio:")
-        self.aspect_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
 
-        self.aspect_entry = QCheckBox("Force")
-        self.aspect_entry.setChecked(self.keep_aspect)
-        self.aspect_entry.stateChanged.connect(self.aspect_entry_changed)
+# Export image sequence dialog
+#   User interface to export an image sequence
+class ExportSequence(ExportDialog):
+    def __init__(self,
+                 width,
+                 height,
+                 parent=None
+                 ):
+        super().__init__(
+            title="Export Sequence",
+            width=width,
+            height=height,
+            fps=60.0,
+            parent=parent
+        )
 
-        self.confirm_buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        self.confirm_buttons.accepted.connect(self.accept)
-        self.confirm_buttons.rejected.connect(self.reject)
+        self.format = Renderer.ImageFormatCode.PNG
 
-        self.main_layout = QGridLayout()
+        # The combo box items, in order, mapped to and from their formats
+        self.format_names = {
+            Renderer.ImageFormatCode.PNG: "PNG (.png)",
+            Renderer.ImageFormatCode.JPEG: "JPEG (.jpg)",
+            Renderer.ImageFormatCode.BITMAP: "BMP (.bmp)"
+        }
+        self.format_list = list(self.format_names)
 
-        self.main_layout.addWidget(self.fps_label, 0, 0)
-        self.main_layout.addWidget(self.fps_entry, 0, 1)
-        self.main_layout.addWidget(self.width_label, 1, 0)
-        self.main_layout.addWidget(self.width_entry, 1, 1)
-        self.main_layout.addWidget(self.height_label, 2, 0)
-        self.main_layout.addWidget(self.height_entry, 2, 1)
-        self.main_layout.addWidget(self.aspect_label, 3, 0)
-        self.main_layout.addWidget(self.aspect_entry, 3, 1)
-        self.main_layout.addWidget(self.confirm_buttons, 4, 0, 1, 2)
+        self.format_label = QLabel("Image Format:")
+        self.format_label.setAlignment(ALIGN_RIGHT)
 
-        self.setLayout(self.main_layout)
+        self.format_entry = QComboBox()
+        self.format_entry.addItems(self.format_names.values())
+        self.format_entry.setCurrentIndex(self.format_list.index(self.format))
 
-        self.resize_window()
+        self.form_rows.append((self.format_label, self.format_entry))
 
-    def resize_window(self):
-        self.setFixedSize(self.sizeHint())
+        self.finish_layout()
 
     def get_settings(self):
-        result = dict()
-        result["width"] = self.width
-        result["height"] = self.height
-        result["fps"] = self.fps
-        result["keep_aspect"] = self.keep_aspect
+        result = super().get_settings()
+        result["format"] = self.get_format()
 
         return result
 
-    def width_entry_changed(self, value):
-        self.width = value
+    def reload(self,
+               width,
+               height
+               ):
+        super().reload(width=width, height=height)
 
-    def height_entry_changed(self, value):
-        self.height = value
+        self.format_entry.setCurrentIndex(self.format_list.index(self.format))
 
-    def aspect_entry_changed(self, value):
-        if value == 0:
-            self.keep_aspect = False
-        else:
-            self.keep_aspect = True
+    def get_format(self):
+        return self.format_list[self.format_entry.currentIndex()]
+
+
+# Export video dialog
+#   User interface to export a video
+class ExportVideo(ExportDialog):
+    def __init__(self,
+                 width,
+                 height,
+                 parent=None
+                 ):
+        super().__init__(
+            title="Export Video",
+            width=width,
+            height=height,
+            fps=60.0,
+            parent=parent
+        )
 
-    def fps_entry_changed(self, value):
-        self.fps = value
+        self.finish_layout()
 
 
 # Hotkey info dialog
@@ -1304,89 +1432,31 @@ class HotkeysInfo(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self.setWindowTitle("Hotkey Info")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
+        self.setWindowIcon(get_icon(ICON_PATH["program"]))
 
         # Hide "?" button
         self.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
 
-        self.play_label = QLabel("Play / Pause:")
-        self.play_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.play_key_label = QLabel("Spacebar")
-        self.play_key_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-
-        self.forward_label = QLabel("Forward:")
-        self.forward_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.forward_key_label = QLabel("Right")
-        self.forward_key_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-
-        self.back_label = QLabel("Back:")
-        self.back_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.back_key_label = QLabel("Left")
-        self.back_key_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-
-        self.frame_forward_label = QLabel("Frame Forward:")
-        self.frame_forward_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.frame_forward_key_label = QLabel(">")
-        self.frame_forward_key_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-
-        self.frame_back_label = QLabel("Frame Back:")
-        self.frame_back_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.frame_back_key_label = QLabel("<")
-        self.frame_back_key_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-
-        self.restart_label = QLabel("Restart:")
-        self.restart_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.restart_key_label = QLabel("R")
-        self.restart_key_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-
-        self.volume_up_label = QLabel("Volume Up:")
-        self.volume_up_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.volume_up_key_label = QLabel("Up")
-        self.volume_up_key_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-
-        self.volume_down_label = QLabel("Volume Down:")
-        self.volume_down_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.volume_down_key_label = QLabel("Down")
-        self.volume_down_key_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-
-        self.mute_label = QLabel("Mute:")
-        self.mute_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-
-        self.mute_key_label = QLabel("M")
-        self.mute_key_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-
         self.confirm_buttons = QDialogButtonBox(QDialogButtonBox.Ok)
         self.confirm_buttons.accepted.connect(self.accept)
 
         self.main_layout = QGridLayout()
 
-        self.main_layout.addWidget(self.play_label, 0, 0)
-        self.main_layout.addWidget(self.play_key_label, 0, 1)
-        self.main_layout.addWidget(self.back_label, 1, 0)
-        self.main_layout.addWidget(self.back_key_label, 1, 1)
-        self.main_layout.addWidget(self.forward_label, 2, 0)
-        self.main_layout.addWidget(self.forward_key_label, 2, 1)
-        self.main_layout.addWidget(self.frame_back_label, 3, 0)
-        self.main_layout.addWidget(self.frame_back_key_label, 3, 1)
-        self.main_layout.addWidget(self.frame_forward_label, 4, 0)
-        self.main_layout.addWidget(self.frame_forward_key_label, 4, 1)
-        self.main_layout.addWidget(self.restart_label, 5, 0)
-        self.main_layout.addWidget(self.restart_key_label, 5, 1)
-        self.main_layout.addWidget(self.volume_up_label, 6, 0)
-        self.main_layout.addWidget(self.volume_up_key_label, 6, 1)
-        self.main_layout.addWidget(self.volume_down_label, 7, 0)
-        self.main_layout.addWidget(self.volume_down_key_label, 7, 1)
-        self.main_layout.addWidget(self.mute_label, 8, 0)
-        self.main_layout.addWidget(self.mute_key_label, 8, 1)
-        self.main_layout.addWidget(self.confirm_buttons, 9, 0, 1, 2)
+        # Build a label pair for each hotkey
+        self.hotkey_labels = [make_label_pair(text, key) for text, key in [
+            ("Play / Pause:", "Spacebar"),
+            ("Back:", "Left"),
+            ("Forward:", "Right"),
+            ("Frame Back:", "<"),
+            ("Frame Forward:", ">"),
+            ("Restart:", "R"),
+            ("Volume Up:", "Up"),
+            ("Volume Down:", "Down"),
+            ("Mute:", "M")
+        ]]
+
+        next_row = add_form_rows(self.main_layout, self.hotkey_labels)
+        self.main_layout.addWidget(self.confirm_buttons, next_row, 0, 1, 2)
 
         self.setLayout(self.main_layout)
 
@@ -1402,23 +1472,23 @@ class RegistrationInfo(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self.setWindowTitle("Registration Info")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
+        self.setWindowIcon(get_icon(ICON_PATH["program"]))
 
         # Hide "?" button
         self.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
 
         self.status_label = QLabel("Status:")
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.status_label.setAlignment(ALIGN_RIGHT)
 
         self.status_value = QLabel()
-        self.status_value.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
+        self.status_value.setAlignment(ALIGN_LEFT)
         self.set_registered_value()
 
         self.serial_label = QLabel("Serial Number:")
-        self.serial_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.serial_label.setAlignment(ALIGN_RIGHT)
 
         self.serial_value = QLabel()
-        self.serial_value.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
+        self.serial_value.setAlignment(ALIGN_LEFT)
         self.set_serial_value()
 
         self.confirm_buttons = QDialogButtonBox(QDialogButtonBox.Close | QDialogButtonBox.Help)
@@ -1428,11 +1498,11 @@ class RegistrationInfo(QDialog):
 
         self.main_layout = QGridLayout()
 
-        self.main_layout.addWidget(self.status_label, 0, 0)
-        self.main_layout.addWidget(self.status_value, 0, 1)
-        self.main_layout.addWidget(self.serial_label, 1, 0)
-        self.main_layout.addWidget(self.serial_value, 1, 1)
-        self.main_layout.addWidget(self.confirm_buttons, 2, 0, 1, 2)
+        next_row = add_form_rows(self.main_layout, [
+            (self.status_label, self.status_value),
+            (self.serial_label, self.serial_value)
+        ])
+        self.main_layout.addWidget(self.confirm_buttons, next_row, 0, 1, 2)
 
         self.setLayout(self.main_layout)
 
@@ -1479,9 +1549,15 @@ class RegistrationInfo(QDialog):
                     with open(KEY_FILE, "w") as f:
                         f.write(SERIAL_KEY)
 
-                    self.set_registered_value()
-                    self.set_serial_value()
-                    self.resize_window()
+                    # Update both labels in one repaint
+                    self.setUpdatesEnabled(False)
+                    try:
+                        self.set_registered_value()
+                        self.set_serial_value()
+                    finally:
+                        self.setUpdatesEnabled(True)
+                    # Resize once the label updates have been laid out
+                    QTimer.singleShot(0, self.resize_window)
 
                     choice = QMessageBox.information(
                         self,
@@ -1512,20 +1588,20 @@ class RegistrationEntry(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self.setWindowTitle("Registration Info")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
+        self.setWindowIcon(get_icon(ICON_PATH["program"]))
 
         # Hide "?" button
         self.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
 
         self.serial = ""
         self.key_is_valid = False
-        self.validator = KeyValidate(TITLE)
+        self.validator = KEY_VALIDATOR
 
         self.info_label = QLabel(f"You can buy a key at the following link:\n{DONATE_URL}")
-        self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.info_label.setAlignment(ALIGN_CENTER)
 
         self.serial_label = QLabel("Serial:")
-        self.serial_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self.serial_label.setAlignment(ALIGN_RIGHT)
 
         self.serial_entry = QLineEdit()
         self.serial_entry.setMaxLength((5 * 4) + 3)
@@ -1580,7 +1656,7 @@ class About(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self.setWindowTitle(f"About {TITLE}")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
+        self.setWindowIcon(get_icon(ICON_PATH["program"]))
 
         # Hide "?" button
         self.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
@@ -1588,14 +1664,13 @@ class About(QDialog):
         self.icon_size = 200
 
         self.icon_label = QLabel()
-        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_label.setPixmap(QPixmap(ICON_PATH["program"]))
+        self.icon_label.setAlignment(ALIGN_CENTER)
+        self.icon_label.setPixmap(get_pixmap(ICON_PATH["program"]))
         self.icon_label.setScaledContents(True)
         self.icon_label.setFixedSize(self.icon_size, self.icon_size)
 
-        self.about_text = QLabel(
-            f"{TITLE} v{VERSION}\nby {COPYRIGHT}\nCopyright 2023\n\n{DESCRIPTION}\n\nProject Home Page:\n{PROJECT_URL}\n\nPatreon:\n{DONATE_URL}")
-        self.about_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.about_text = QLabel(ABOUT_TEXT)
+        self.about_text.setAlignment(ALIGN_CENTER)
 
         self.confirm_buttons = QDialogButtonBox(QDialogButtonBox.Ok)
         self.confirm_buttons.accepted.connect(self.accept)
@@ -1626,6 +1701,9 @@ class ImageButton(QAbstractButton):
                  ):
         super(ImageButton, self).__init__(parent)
 
+        self.hovered = False
+        self.pixmap = None  # Pre-init this to make sure set_scale works
+
         self.set_scale(scale)
         self.change_pixmaps(
             pixmap=pixmap,
@@ -1633,8 +1711,8 @@ class ImageButton(QAbstractButton):
             pixmap_pressed=pixmap_pressed
         )
 
-        self.pressed.connect(self.update)
-        self.released.connect(self.update)
+        self.pressed.connect(self.update_current_pixmap)
+        self.released.connect(self.update_current_pixmap)
 
     def change_pixmaps(self,
                        pixmap,
@@ -1645,33 +1723,50 @@ class ImageButton(QAbstractButton):
         self.pixmap_hover = pixmap_hover
         self.pixmap_pressed = pixmap_pressed
 
-        self.width = round(self.pixmap.width() * self.scale)
-        self.height = round(self.pixmap.height() * self.scale)
+        self.update_size()
+        self.update_current_pixmap()
 
-        self.update()
+    # Change all three pixmaps from a (base, hover, pressed) tuple
+    def set_pixmaps(self, pixmaps):
+        self.change_pixmaps(*pixmaps)
 
     def set_scale(self, scale_factor):
         self.scale = scale_factor
 
-    def paintEvent(self, event):
+        if self.pixmap is not None:
+            self.update_size()
+
+    # Compute the scaled size once, so sizeHint doesn't build a new QSize per layout query
+    def update_size(self):
+        self.width = round(self.pixmap.width() * self.scale)
+        self.height = round(self.pixmap.height() * self.scale)
+        self.size_hint = QSize(self.width, self.height)
+
+    # Pick the pixmap to draw when the button state changes, not on every repaint
+    def update_current_pixmap(self):
         if self.isDown():
-            pix = self.pixmap_pressed
-        elif self.underMouse():
-            pix = self.pixmap_hover
+            self.current_pixmap = self.pixmap_pressed
+        elif self.hovered:
+            self.current_pixmap = self.pixmap_hover
         else:
-            pix = self.pixmap
+            self.current_pixmap = self.pixmap
+
+        self.update()
 
+    def paintEvent(self, event):
         painter = QPainter(self)
-        painter.drawPixmap(event.rect(), pix)
+        painter.drawPixmap(event.rect(), self.current_pixmap)
 
     def enterEvent(self, event):
-        self.update()
+        self.hovered = True
+        self.update_current_pixmap()
 
     def leaveEvent(self, event):
-        self.update()
+        self.hovered = False
+        self.update_current_pixmap()
 
     def sizeHint(self):
-        return QSize(self.width, self.height)
+        return self.size_hint
 
 
 # Custom seekbar class
@@ -1683,34 +1778,85 @@ class SeekBar(QSlider):
                  ):
         super(SeekBar, self).__init__(parent)
 
-        self.handle_size = 10
+        self.handle_size = SEEKBAR_HANDLE_SIZE
         # TODO: Fix handle width not changing
         # TODO: Fix handle not hanging over the side
 
         self.setFixedHeight(self.handle_size)
 
-        self.setStyleSheet(
-            "QSlider::handle {{ background: #666; height: {0}px; width: {0}px; border-radius: {1}px; }} QSlider::handle:hover {{ background: #000; height: {0}px; width: {0}px; border-radius: {1}px; }}".format(
-                self.handle_size, math.floor(self.handle_size / 2)))
+        # Styled by APP_STYLESHEET
+        self.setObjectName("seekBar")
+
+        # Plain copies of the range and width, so mouse events don't have to query Qt
+        self.range_min = self.minimum()
+        self.range_max = self.maximum()
+        self.cached_width = self.width()
 
         self.position_changed_function = position_changed_function
 
+        # Coalesce drag seeks, so at most one is sent per throttle interval
+        self.pending_value = None
+        self.throttle_timer = QTimer(self)
+        self.throttle_timer.setSingleShot(True)
+        self.throttle_timer.setInterval(0)
+        self.throttle_timer.timeout.connect(self.flush_pending_value)
+
     def set_position_changed_function(self, position_changed_function):
         self.position_changed_function = position_changed_function
 
+    def set_throttle_interval(self, ms):
+        self.throttle_timer.setInterval(ms)
+
+    def flush_pending_value(self):
+        if self.pending_value is not None:
+            value = self.pending_value
+            self.pending_value = None
+            self.set_position_if_set(value)
+
+    # Move the handle for playback updates without emitting any slider signals
+    def set_value_silently(self, value):
+        self.blockSignals(True)
+        self.setValue(value)
+        self.blockSignals(False)
+
     def set_position_if_set(self, value):
-        if self.position_changed_function == None:
+        if self.position_changed_function is None:
             self.setValue(value)
         else:
             self.position_changed_function(value)
 
+    def sliderChange(self, change):
+        if change == QSlider.SliderRangeChange:
+            self.range_min = self.minimum()
+            self.range_max = self.maximum()
+
+        super().sliderChange(change)
+
+    def resizeEvent(self, event):
+        self.cached_width = event.size().width()
+
+        super().resizeEvent(event)
+
     def mousePressEvent(self, event):
-        value = QStyle.sliderValueFromPosition(self.minimum(), self.maximum(), event.x(), self.width())
+        value = QStyle.sliderValueFromPosition(self.range_min, self.range_max, event.x(), self.cached_width)
+        self.pending_value = None
         self.set_position_if_set(value)
 
     def mouseMoveEvent(self, event):
-        value = QStyle.sliderValueFromPosition(self.minimum(), self.maximum(), event.x(), self.width())
-        self.set_position_if_set(value)
+        value = QStyle.sliderValueFromPosition(self.range_min, self.range_max, event.x(), self.cached_width)
+        self.pending_value = value
+        if not self.throttle_timer.isActive():
+            self.throttle_timer.start()
+
+    # Forget a drag seek that hasn't been sent yet
+    def cancel_pending_value(self):
+        self.throttle_timer.stop()
+        self.pending_value = None
+
+    def mouseReleaseEvent(self, event):
+        # Make sure the drag ends exactly where the mouse was let go
+        self.throttle_timer.stop()
+        self.flush_pending_value()
 
 
 # My QMainWindow class
@@ -1721,7 +1867,13 @@ class MyQMainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"{TITLE}")
-        self.setWindowIcon(QIcon(ICON_PATH["program"]))
+        self.setWindowIcon(get_icon(ICON_PATH["program"]))
+
+        # Decode the button and volume icons while the rest of the window is built
+        preload_images(
+            [path for button in ICON_PATH["button"].values() for path in button.values()]
+            + list(ICON_PATH["volume"].values())
+        )
 
         self.bw = BinaryWaterfall()
 
@@ -1732,96 +1884,61 @@ class MyQMainWindow(QMainWindow):
         )
 
         self.padding_px = 10
+        self.resize_pending = False
+
+        # Resizing waits for the queued layout requests to run first
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(0)
+        self.resize_timer.timeout.connect(self.resize_window_helper)
 
         self.seek_bar = SeekBar()
         self.seek_bar.setFocusPolicy(Qt.NoFocus)
         self.seek_bar.setOrientation(Qt.Horizontal)
         self.seek_bar.setMinimum(0)
         self.update_seekbar()
-        self.seek_bar.sliderMoved.connect(self.seekbar_moved)
 
         self.player_label = QLabel()
-        self.player_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.player_label.setAlignment(ALIGN_CENTER)
 
         self.player = Player(
             binary_waterfall=self.bw,
             display=self.player_label,
             set_playbutton_function=self.set_play_button,
-            set_seekbar_function=self.seek_bar.setValue
+            set_seekbar_function=self.seek_bar.set_value_silently
         )
 
         self.current_volume = self.player.volume
 
         # Setup seek bar to correctly change player location
         self.seek_bar.set_position_changed_function(self.seekbar_moved)
+        self.seek_bar.set_throttle_interval(self.player.frame_ms)
 
         self.set_file_savename()
 
         # Save the pixmaps for later
-        self.play_icons = {
-            "play": {
-                "base": QPixmap(ICON_PATH["button"]["play"]["base"]),
-                "hover": QPixmap(ICON_PATH["button"]["play"]["hover"]),
-                "clicked": QPixmap(ICON_PATH["button"]["play"]["clicked"])
-            },
-            "pause": {
-                "base": QPixmap(ICON_PATH["button"]["pause"]["base"]),
-                "hover": QPixmap(ICON_PATH["button"]["pause"]["hover"]),
-                "clicked": QPixmap(ICON_PATH["button"]["pause"]["clicked"])
-            }
-        }
+        self.play_pixmaps = get_button_pixmaps("play")
+        self.pause_pixmaps = get_button_pixmaps("pause")
 
-        self.transport_play = ImageButton(
-            pixmap=self.play_icons["play"]["base"],
-            pixmap_hover=self.play_icons["play"]["hover"],
-            pixmap_pressed=self.play_icons["play"]["clicked"],
-            scale=1.0,
-            parent=self
-        )
-        self.transport_play.setFocusPolicy(Qt.NoFocus)
-        self.transport_play.setFixedSize(self.transport_play.width, self.transport_play.height)
+        self.transport_play = self.make_image_button("play", scale=1.0)
         self.transport_play.clicked.connect(self.play_clicked)
 
-        self.transport_forward = ImageButton(
-            pixmap=QPixmap(ICON_PATH["button"]["forward"]["base"]),
-            pixmap_hover=QPixmap(ICON_PATH["button"]["forward"]["hover"]),
-            pixmap_pressed=QPixmap(ICON_PATH["button"]["forward"]["clicked"]),
-            scale=0.75,
-            parent=self
-        )
-        self.transport_forward.setFocusPolicy(Qt.NoFocus)
-        self.transport_forward.setFixedSize(self.transport_forward.width, self.transport_forward.height)
+        self.transport_forward = self.make_image_button("forward", scale=0.75)
         self.transport_forward.clicked.connect(self.forward_clicked)
 
-        self.transport_back = ImageButton(
-            pixmap=QPixmap(ICON_PATH["button"]["back"]["base"]),
-            pixmap_hover=QPixmap(ICON_PATH["button"]["back"]["hover"]),
-            pixmap_pressed=QPixmap(ICON_PATH["button"]["back"]["clicked"]),
-            scale=0.75,
-            parent=self
-        )
-        self.transport_back.setFocusPolicy(Qt.NoFocus)
-        self.transport_back.setFixedSize(self.transport_back.width, self.transport_back.height)
+        self.transport_back = self.make_image_button("back", scale=0.75)
         self.transport_back.clicked.connect(self.back_clicked)
 
-        self.transport_restart = ImageButton(
-            pixmap=QPixmap(ICON_PATH["button"]["restart"]["base"]),
-            pixmap_hover=QPixmap(ICON_PATH["button"]["restart"]["hover"]),
-            pixmap_pressed=QPixmap(ICON_PATH["button"]["restart"]["clicked"]),
-            scale=0.5,
-            parent=self
-        )
-        self.transport_restart.setFocusPolicy(Qt.NoFocus)
-        self.transport_restart.setFixedSize(self.transport_restart.width, self.transport_restart.height)
+        self.transport_restart = self.make_image_button("restart", scale=0.5)
         self.transport_restart.clicked.connect(self.restart_clicked)
 
         self.volume_icons = {
-            "base": QPixmap(ICON_PATH["volume"]["base"]),
-            "mute": QPixmap(ICON_PATH["volume"]["mute"]),
+            "base": get_pixmap(ICON_PATH["volume"]["base"]),
+            "mute": get_pixmap(ICON_PATH["volume"]["mute"]),
         }
 
         self.volume_icon = QLabel()
-        self.volume_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.volume_icon.setAlignment(ALIGN_CENTER)
         self.volume_icon.setScaledContents(True)
         self.volume_icon.setFixedSize(20, 20)
         self.set_volume_icon(mute=self.is_player_muted())
@@ -1829,13 +1946,13 @@ class MyQMainWindow(QMainWindow):
         self.volume_icon.mousePressEvent = self.volume_icon_clicked
 
         self.volume_label = QLabel()
-        self.volume_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.volume_label.setAlignment(ALIGN_CENTER)
         self.volume_label.setFixedWidth(30)
         self.set_volume_label_value(self.current_volume)
 
         self.volume_slider = QSlider(Qt.Vertical)
-        self.volume_slider.setStyleSheet(
-            "QSlider::handle { background: #666; } QSlider::handle:hover { background: #000; }")
+        # Styled by APP_STYLESHEET
+        self.volume_slider.setObjectName("volumeSlider")
         self.volume_slider.setFocusPolicy(Qt.NoFocus)
         self.volume_slider.setFixedSize(20, 50)
         self.volume_slider.setMinimum(0)
@@ -1862,20 +1979,20 @@ class MyQMainWindow(QMainWindow):
         self.voume_layout.addWidget(self.volume_label, 1, 0,
                                     alignment=Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
         self.voume_layout.addWidget(self.volume_slider, 0, 1, 2, 1,
-                                    alignment=Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
+                                    alignment=ALIGN_LEFT)
 
         self.main_layout = QGridLayout()
         self.main_layout.setContentsMargins(0, 0, 0, self.padding_px)
         self.main_layout.setSpacing(self.padding_px)
 
-        self.main_layout.addWidget(self.player_label, 0, 0, 1, 5, alignment=Qt.AlignmentFlag.AlignCenter)
-        self.main_layout.addWidget(self.seek_bar, 1, 0, 1, 5, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.main_layout.addWidget(self.player_label, 0, 0, 1, 5, alignment=ALIGN_CENTER)
+        self.main_layout.addWidget(self.seek_bar, 1, 0, 1, 5, alignment=ALIGN_CENTER)
         self.main_layout.addLayout(self.transport_left_layout, 2, 1,
-                                   alignment=Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-        self.main_layout.addWidget(self.transport_play, 2, 2, alignment=Qt.AlignmentFlag.AlignCenter)
+                                   alignment=ALIGN_RIGHT)
+        self.main_layout.addWidget(self.transport_play, 2, 2, alignment=ALIGN_CENTER)
         self.main_layout.addLayout(self.transport_right_layout, 2, 3,
-                                   alignment=Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        self.main_layout.addLayout(self.voume_layout, 2, 4, alignment=Qt.AlignmentFlag.AlignCenter)
+                                   alignment=ALIGN_LEFT)
+        self.main_layout.addLayout(self.voume_layout, 2, 4, alignment=ALIGN_CENTER)
 
         self.main_widget = QWidget()
         self.main_widget.setLayout(self.main_layout)
@@ -1883,102 +2000,119 @@ class MyQMainWindow(QMainWindow):
 
         self.main_menu = self.menuBar()
 
-        self.file_menu = self.main_menu.addMenu("File")
-
-        self.file_menu_open = QAction("Open...", self)
-        self.file_menu_open.triggered.connect(self.open_file_clicked)
-        self.file_menu.addAction(self.file_menu_open)
-
-        self.file_menu_close = QAction("Close", self)
-        self.file_menu_close.triggered.connect(self.close_file_clicked)
-        self.file_menu.addAction(self.file_menu_close)
-
-        self.settings_menu = self.main_menu.addMenu("Settings")
-
-        self.settings_menu_audio = QAction("Audio...", self)
-        self.settings_menu_audio.triggered.connect(self.audio_settings_clicked)
-        self.settings_menu.addAction(self.settings_menu_audio)
-
-        self.settings_menu_video = QAction("Video...", self)
-        self.settings_menu_video.triggered.connect(self.video_settings_clicked)
-        self.settings_menu.addAction(self.settings_menu_video)
-
-        self.settings_menu_player = QAction("Player...", self)
-        self.settings_menu_player.triggered.connect(self.player_settings_clicked)
-        self.settings_menu.addAction(self.settings_menu_player)
-
-        self.export_menu = self.main_menu.addMenu("Export")
-
-        self.export_menu_audio = QAction("Audio...", self)
-        self.export_menu_audio.triggered.connect(self.export_audio_clicked)
-        self.export_menu.addAction(self.export_menu_audio)
-
-        self.export_menu_image = QAction("Image...", self)
-        self.export_menu_image.triggered.connect(self.export_image_clicked)
-        self.export_menu.addAction(self.export_menu_image)
-
-        self.export_menu_sequence = QAction("Image Sequence...", self)
-        self.export_menu_sequence.triggered.connect(self.export_sequence_clicked)
-        self.export_menu.addAction(self.export_menu_sequence)
+        # Build the menus from (menu title, [(action text, handler), ...])
+        self.menus = dict()
+        self.menu_actions = dict()
+        for menu_title, actions in [
+            ("File", [
+                ("Open...", self.open_file_clicked),
+                ("Close", self.close_file_clicked)
+            ]),
+            ("Settings", [
+                ("Audio...", self.audio_settings_clicked),
+                ("Video...", self.video_settings_clicked),
+                ("Player...", self.player_settings_clicked)
+            ]),
+            ("Export", [
+                ("Audio...", self.export_audio_clicked),
+                ("Image...", self.export_image_clicked),
+                ("Image Sequence...", self.export_sequence_clicked),
+                ("Video...", self.export_video_clicked)
+            ]),
+            ("Help", [
+                ("Hotkeys...", self.hotkeys_clicked),
+                ("Registration...", self.registration_clicked),
+                ("About...", self.about_clicked)
+            ])
+        ]:
+            menu = self.main_menu.addMenu(menu_title)
+            self.menus[menu_title] = menu
+
+            for action_text, handler in actions:
+                action = menu.addAction(action_text)
+                action.triggered.connect(handler)
+                self.menu_actions[(menu_title, action_text)] = action
+
+        # Dialogs are built on first use and reused after that
+        self.dialogs = dict()
+
+        # Map hotkeys to their functions
+        self.key_functions = {
+            Qt.Key_Space: self.play_clicked,
+            Qt.Key_Left: self.back_clicked,
+            Qt.Key_Right: self.forward_clicked,
+            Qt.Key_Up: self.volume_up,
+            Qt.Key_Down: self.volume_down,
+            Qt.Key_M: self.toggle_mute,
+            Qt.Key_R: self.restart_clicked,
+            Qt.Key_Comma: self.player.frame_back,
+            Qt.Key_Period: self.player.frame_forward
+        }
 
-        self.export_menu_video = QAction("Video...", self)
-        self.export_menu_video.triggered.connect(self.export_video_clicked)
-        self.export_menu.addAction(self.export_menu_video)
+        self.set_volume(self.current_volume, force=True)
 
-        self.help_menu = self.main_menu.addMenu("Help")
+        # Set window to content size
+        self.resize_window()
 
-        self.help_menu_hotkeys = QAction("Hotkeys...", self)
-        self.help_menu_hotkeys.triggered.connect(self.hotkeys_clicked)
-        self.help_menu.addAction(self.help_menu_hotkeys)
+    def keyPressEvent(self, event):
+        key_function = self.key_functions.get(event.key())
+        if key_function is not None:
+            key_function()
+
+    # Make a fixed-size transport button from the cached pixmaps in ICON_PATH["button"][name]
+    def make_image_button(self, name, scale):
+        # The pixmaps come pre-scaled, so the button draws them 1:1 instead of resampling on every paint
+        pixmap, pixmap_hover, pixmap_pressed = get_button_pixmaps(name, scale)
+        button = ImageButton(
+            pixmap=pixmap,
+            pixmap_hover=pixmap_hover,
+            pixmap_pressed=pixmap_pressed,
+            scale=1.0,
+            parent=self
+        )
+        button.setFocusPolicy(Qt.NoFocus)
+        button.setFixedSize(button.size_hint)
 
-        self.help_menu_registration = QAction("Registration...", self)
-        self.help_menu_registration.triggered.connect(self.registration_clicked)
-        self.help_menu.addAction(self.help_menu_registration)
+        return button
 
-        self.help_menu_about = QAction("About...", self)
-        self.help_menu_about.triggered.connect(self.about_clicked)
-        self.help_menu.addAction(self.help_menu_about)
+    def get_dialog(self, dialog_class, **kwargs):
+        popup = self.dialogs.get(dialog_class)
+        if popup is None:
+            popup = dialog_class(**kwargs, parent=self)
+            self.dialogs[dialog_class] = popup
+        elif kwargs:
+            # Dialogs without settings have nothing to reload
+            popup.reload(**kwargs)
 
-        self.set_volume(self.current_volume)
+        return popup
 
-        # Set window to content size
-        self.resize_window()
+    def volume_up(self):
+        new_volume = min(self.current_volume + 5, 100)
+        self.set_volume(new_volume)
 
-    def keyPressEvent(self, event):
-        key = event.key()
-
-        if key == Qt.Key_Space:
-            self.play_clicked()
-        elif key == Qt.Key_Left:
-            self.back_clicked()
-        elif key == Qt.Key_Right:
-            self.forward_clicked()
-        elif key == Qt.Key_Up:
-            new_volume = min(self.current_volume + 5, 100)
-            self.set_volume(new_volume)
-        elif key == Qt.Key_Down:
-            new_volume = max(self.current_volume - 5, 0)
-            self.set_volume(new_volume)
-        elif key == Qt.Key_M:
-            self.toggle_mute()
-        elif key == Qt.Key_R:
-            self.restart_clicked()
-        elif key == Qt.Key_Comma:
-            self.player.frame_back()
-        elif key == Qt.Key_Period:
-            self.player.frame_forward()
+    def volume_down(self):
+        new_volume = max(self.current_volume - 5, 0)
+        self.set_volume(new_volume)
 
     def resize_window(self):
-        # First, make largest elements smaller
-        self.seek_bar.setFixedWidth(20)
+        # Several changes in a row only need one resize
+        if self.resize_pending:
+            return
+        self.resize_pending = True
+
+        # First, let the seek bar shrink so it doesn't hold the window width
+        self.seek_bar.setMinimumWidth(0)
+        self.seek_bar.setMaximumWidth(QWIDGETSIZE_MAX)
 
         # Next, we update counterpadding
         self.update_counterpad_size()
 
-        # We need to wait a sec for the sizeHint to recompute
-        QTimer.singleShot(10, self.resize_window_helper)
+        # Let the queued layout requests run so the sizeHint is recomputed
+        self.resize_timer.start()
 
     def resize_window_helper(self):
+        self.resize_pending = False
+
         size_hint = self.sizeHint()
         self.setFixedSize(size_hint)
 
@@ -1988,18 +2122,7 @@ class MyQMainWindow(QMainWindow):
         self.restart_counterpad.setFixedSize(self.transport_restart.sizeHint())
 
     def set_play_button(self, play):
-        if play:
-            self.transport_play.change_pixmaps(
-                pixmap=self.play_icons["play"]["base"],
-                pixmap_hover=self.play_icons["play"]["hover"],
-                pixmap_pressed=self.play_icons["play"]["clicked"]
-            )
-        else:
-            self.transport_play.change_pixmaps(
-                pixmap=self.play_icons["pause"]["base"],
-                pixmap_hover=self.play_icons["pause"]["hover"],
-                pixmap_pressed=self.play_icons["pause"]["clicked"]
-            )
+        self.transport_play.set_pixmaps(self.play_pixmaps if play else self.pause_pixmaps)
 
     def is_player_muted(self):
         if self.player.volume == 0:
@@ -2016,12 +2139,19 @@ class MyQMainWindow(QMainWindow):
     def set_volume_label_value(self, value):
         self.volume_label.setText(f"{value}%")
 
-    def set_volume(self, value):
+    def set_volume(self, value, force=False):
+        # Nothing to do if the volume didn't change (e.g. holding Up at 100%)
+        if value == self.current_volume and not force:
+            return
+
         self.current_volume = value
 
         self.player.set_volume(self.current_volume)
         self.set_volume_label_value(self.current_volume)
+        # Don't re-enter through volume_slider_changed
+        self.volume_slider.blockSignals(True)
         self.volume_slider.setValue(self.player.volume)
+        self.volume_slider.blockSignals(False)
 
         if self.current_volume > 0:
             self.unmute_volume = self.current_volume
@@ -2032,7 +2162,7 @@ class MyQMainWindow(QMainWindow):
             self.set_volume_icon(mute=False)
 
     def update_seekbar(self):
-        if self.bw.filename == None:
+        if self.bw.filename is None:
             self.seek_bar.setEnabled(False)
             self.seek_bar.setValue(0)
         else:
@@ -2080,7 +2210,7 @@ class MyQMainWindow(QMainWindow):
         self.set_volume(value)
 
     def set_file_savename(self, name=None):
-        if name == None:
+        if name is None:
             self.file_savename = "Untitled"
         else:
             self.file_savename = name
@@ -2096,7 +2226,24 @@ class MyQMainWindow(QMainWindow):
         )
 
         if filename != "":
-            self.player.open_file(filename=filename)
+            self.player.close_file()
+
+            # Writing the audio file can take a while, so do it in the background with the window locked
+            #   The file is changed on the worker thread, so no timers may read it until it's done
+            self.player.render_timer.stop()
+            self.seek_bar.cancel_pending_value()
+            self.resize_timer.stop()
+            self.setEnabled(False)
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                self.run_in_background(self.player.load_file, filename=filename)
+            finally:
+                QApplication.restoreOverrideCursor()
+                self.setEnabled(True)
+                if self.resize_pending:
+                    self.resize_timer.start()
+
+            self.player.show_file()
 
             file_path, file_title = os.path.split(filename)
             file_savename, file_ext = os.path.splitext(file_title)
@@ -2116,12 +2263,12 @@ class MyQMainWindow(QMainWindow):
         self.update_seekbar()
 
     def audio_settings_clicked(self):
-        popup = AudioSettings(
+        popup = self.get_dialog(
+            AudioSettings,
             num_channels=self.bw.num_channels,
             sample_bytes=self.bw.sample_bytes,
             sample_rate=self.bw.sample_rate,
-            volume=self.bw.volume,
-            parent=self
+            volume=self.bw.volume
         )
 
         result = popup.exec()
@@ -2136,12 +2283,12 @@ class MyQMainWindow(QMainWindow):
             )
 
     def video_settings_clicked(self):
-        popup = VideoSettings(
+        popup = self.get_dialog(
+            VideoSettings,
             bw=self.bw,
             width=self.bw.width,
             height=self.bw.height,
-            color_format=self.bw.get_color_format_string(),
-            parent=self
+            color_format=self.bw.get_color_format_string()
         )
 
         result = popup.exec()
@@ -2155,14 +2302,13 @@ class MyQMainWindow(QMainWindow):
             self.bw.set_color_format(video_settings["color_format"])
             self.player.refresh_dims()
             self.player.update_image()
-            # We need to wait a moment for the size hint to be computed
-            QTimer.singleShot(10, self.resize_window)
+            self.resize_window()
 
     def player_settings_clicked(self):
-        popup = PlayerSettings(
+        popup = self.get_dialog(
+            PlayerSettings,
             max_view_dim=self.player.max_dim,
-            fps=self.player.fps,
-            parent=self
+            fps=self.player.fps
         )
 
         result = popup.exec()
@@ -2170,12 +2316,12 @@ class MyQMainWindow(QMainWindow):
         if result:
             player_settings = popup.get_player_settings()
             self.player.set_fps(fps=player_settings["fps"])
+            self.seek_bar.set_throttle_interval(self.player.frame_ms)
             self.player.update_dims(max_dim=player_settings["max_view_dim"])
-            # We need to wait a moment for the size hint to be computed
-            QTimer.singleShot(10, self.resize_window)
+            self.resize_window()
 
     def export_image_clicked(self):
-        if self.bw.audio_filename == None:
+        if self.bw.audio_filename is None:
             choice = QMessageBox.critical(
                 self,
                 "Error",
@@ -2184,10 +2330,10 @@ class MyQMainWindow(QMainWindow):
             )
             return
 
-        popup = ExportFrame(
+        popup = self.get_dialog(
+            ExportFrame,
             width=self.player.width,
-            height=self.player.height,
-            parent=self
+            height=self.player.height
         )
 
         result = popup.exec()
@@ -2228,7 +2374,7 @@ class MyQMainWindow(QMainWindow):
                     )
 
     def export_audio_clicked(self):
-        if self.bw.audio_filename == None:
+        if self.bw.audio_filename is None:
             choice = QMessageBox.critical(
                 self,
                 "Error",
@@ -2237,6 +2383,15 @@ class MyQMainWindow(QMainWindow):
             )
             return
 
+        if self.bw.audio_length_ms == 0:
+            choice = QMessageBox.critical(
+                self,
+                "Error",
+                "The open file is too short to make any audio.\n\nPlease open a bigger file, or change the audio settings.",
+                QMessageBox.Cancel
+            )
+            return
+
         filename, filetype = QFileDialog.getSaveFileName(
             self,
             "Export Audio As...",
@@ -2266,8 +2421,28 @@ class MyQMainWindow(QMainWindow):
                     QMessageBox.Ok
                 )
 
+    # Runs a function on a worker thread and waits for it without blocking the UI
+    #   With report_progress, the function gets a stand-in for progress_popup as its progress_dialog
+    #   Any error raised by the function is re-raised here
+    def run_in_background(self, function, progress_popup=None, report_progress=False, **kwargs):
+        progress = TaskProgress(progress_popup)
+        if report_progress:
+            kwargs["progress_dialog"] = progress
+        worker = TaskWorker(function, progress, **kwargs)
+
+        loop = QEventLoop()
+        progress.finished.connect(loop.quit, Qt.QueuedConnection)
+
+        if progress_popup is not None:
+            progress_popup.show()
+        QThreadPool.globalInstance().start(worker)
+        loop.exec()
+
+        if progress.error is not None:
+            raise progress.error
+
     def export_sequence_clicked(self):
-        if self.bw.audio_filename == None:
+        if self.bw.audio_filename is None:
             choice = QMessageBox.critical(
                 self,
                 "Error",
@@ -2276,10 +2451,10 @@ class MyQMainWindow(QMainWindow):
             )
             return
 
-        popup = ExportSequence(
+        popup = self.get_dialog(
+            ExportSequence,
             width=self.player.width,
-            height=self.player.height,
-            parent=self
+            height=self.player.height
         )
 
         result = popup.exec()
@@ -2287,6 +2462,19 @@ class MyQMainWindow(QMainWindow):
         if result:
             settings = popup.get_settings()
 
+            frame_count = self.renderer.get_frame_count(
+                fps=settings["fps"]
+            )
+            if frame_count == 0:
+                choice = QMessageBox.critical(
+                    self,
+                    "Error",
+                    f"The open file is too short to make any frames at {settings['fps']} fps.\n\n"
+                    f"Please open a bigger file, or raise the framerate.",
+                    QMessageBox.Cancel
+                )
+                return
+
             file_dir = QFileDialog.getExistingDirectory(
                 self,
                 "Export Image Sequence To...",
@@ -2296,9 +2484,6 @@ class MyQMainWindow(QMainWindow):
             if file_dir != "":
                 file_dir_parent, file_dir_title = os.path.split(file_dir)
                 self.last_save_location = file_dir_parent
-                frame_count = self.renderer.get_frame_count(
-                    fps=settings["fps"]
-                )
                 progress_popup = QProgressDialog("Exporting image sequence...", "Abort", 0, frame_count, self)
                 progress_popup.setWindowModality(Qt.WindowModal)
                 progress_popup.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
@@ -2306,13 +2491,15 @@ class MyQMainWindow(QMainWindow):
                 progress_popup.setFixedSize(300, 100)
 
                 try:
-                    self.renderer.export_sequence(
+                    self.run_in_background(
+                        self.renderer.export_sequence,
+                        progress_popup,
+                        report_progress=True,
                         directory=file_dir,
                         size=(settings["width"], settings["height"]),
                         fps=settings["fps"],
                         keep_aspect=settings["keep_aspect"],
-                        format=settings["format"],
-                        progress_dialog=progress_popup
+                        format=settings["format"]
                     )
                 except Exception as e:
                     progress_popup.cancel()
@@ -2340,7 +2527,7 @@ class MyQMainWindow(QMainWindow):
                         )
 
     def export_video_clicked(self):
-        if self.bw.audio_filename == None:
+        if self.bw.audio_filename is None:
             choice = QMessageBox.critical(
                 self,
                 "Error",
@@ -2360,10 +2547,10 @@ class MyQMainWindow(QMainWindow):
             if choice == QMessageBox.Cancel:
                 return
 
-        popup = ExportVideo(
+        popup = self.get_dialog(
+            ExportVideo,
             width=self.player.width,
-            height=self.player.height,
-            parent=self
+            height=self.player.height
         )
 
         result = popup.exec()
@@ -2371,6 +2558,19 @@ class MyQMainWindow(QMainWindow):
         if result:
             settings = popup.get_settings()
 
+            frame_count = self.renderer.get_frame_count(
+                fps=settings["fps"]
+            )
+            if frame_count == 0:
+                choice = QMessageBox.critical(
+                    self,
+                    "Error",
+                    f"The open file is too short to make any frames at {settings['fps']} fps.\n\n"
+                    f"Please open a bigger file, or raise the framerate.",
+                    QMessageBox.Cancel
+                )
+                return
+
             filename, filetype = QFileDialog.getSaveFileName(
                 self,
                 "Export Video As...",
@@ -2383,9 +2583,6 @@ class MyQMainWindow(QMainWindow):
             if filename != "":
                 file_path, file_title = os.path.split(filename)
                 self.last_save_location = file_path
-                frame_count = self.renderer.get_frame_count(
-                    fps=settings["fps"]
-                )
                 progress_popup = QProgressDialog("Rendering frames...", "Abort", 0, frame_count, self)
                 progress_popup.setWindowModality(Qt.WindowModal)
                 progress_popup.setWindowFlags(self.windowFlags() ^ Qt.WindowContextHelpButtonHint)
@@ -2398,13 +2595,15 @@ class MyQMainWindow(QMainWindow):
                     add_watermark = True
 
                 try:
-                    self.renderer.export_video(
+                    self.run_in_background(
+                        self.renderer.export_video,
+                        progress_popup,
+                        report_progress=True,
                         filename=filename,
                         size=(settings["width"], settings["height"]),
                         fps=settings["fps"],
                         keep_aspect=settings["keep_aspect"],
-                        watermark=add_watermark,
-                        progress_dialog=progress_popup
+                        watermark=add_watermark
                     )
                 except Exception as e:
                     progress_popup.cancel()
@@ -2431,17 +2630,17 @@ class MyQMainWindow(QMainWindow):
                         )
 
     def hotkeys_clicked(self):
-        popup = HotkeysInfo(parent=self)
+        popup = self.get_dialog(HotkeysInfo)
 
         result = popup.exec()
 
     def registration_clicked(self):
-        popup = RegistrationInfo(parent=self)
+        popup = self.get_dialog(RegistrationInfo)
 
         result = popup.exec()
 
     def about_clicked(self):
-        popup = About(parent=self)
+        popup = self.get_dialog(About)
 
         result = popup.exec()
 
@@ -2465,26 +2664,41 @@ class Player:
 
         self.display = display
 
+        self.watermarker = WATERMARKER
+
+        # Watermarked black frames shown when no file is open, by display size
+        self.blank_images = dict()
+
         self.set_dims(max_dim=max_dim)
 
         self.set_play_button = set_playbutton_function
         self.set_seekbar_function = set_seekbar_function
 
+        # How often the audio reports its position, the render timer handles smooth playback
+        self.position_notify_ms = 250
+
         # Initialize player as black
         self.clear_image()
 
         # Make the QMediaPlayer for audio playback
         self.audio = QMediaPlayer()
+        # Closing a file always sets the same empty media
+        self.empty_media = QMediaContent()
         # self.audio_output = QAudioOutput()
         # self.audio.setAudioOutput(self.audio_output)
 
         # Set audio playback settings
         self.set_volume(100)
 
-        # Set set_image_timestamp to run when the audio position is changed
-        self.audio.positionChanged.connect(self.set_image_timestamp)
-        self.audio.positionChanged.connect(self.set_seekbar_if_given)
-        # Also, make sure it's updating more frequently (default is too slow when playing)
+        # Set position_changed to run when the audio position is changed (seeks, and slow ticks while playing)
+        self.audio.positionChanged.connect(self.position_changed)
+        self.audio.setNotifyInterval(self.position_notify_ms)
+
+        # While playing, a precise timer pulls the audio position once per frame instead
+        self.render_timer = QTimer()
+        self.render_timer.setTimerType(Qt.PreciseTimer)
+        self.render_timer.timeout.connect(self.render_tick)
+
         self.fps_min = 1
         self.fps_max = 120
         self.set_fps(fps)
@@ -2508,36 +2722,41 @@ class Player:
 
     def set_fps(self, fps):
         self.fps = min(max(fps, self.fps_min), self.fps_max)
-        self.frame_ms = math.floor(1000 / self.fps)
-        self.audio.setNotifyInterval(self.frame_ms)
+        self.frame_ms = 1000 // int(self.fps)
+        self.render_timer.setInterval(self.frame_ms)
 
     def clear_image(self):
-        background_image = Image.new(
-            mode="RGBA",
-            size=(self.width, self.height),
-            color="#000"
-        )
+        # The black frame only depends on the display size, so it's only built once for each size
+        if self.dim not in self.blank_images:
+            background_image = Image.new(
+                mode="RGBA",
+                size=self.dim,
+                color="#000"
+            )
 
-        background_image = Watermarker().mark(background_image)
+            background_image = self.watermarker.mark(background_image)
 
-        img_bytestring = background_image.convert("RGB").tobytes()
+            img_bytestring = background_image.convert("RGB").tobytes()
 
-        qimg = QImage(
-            img_bytestring,
-            self.width,
-            self.height,
-            3 * self.width,
-            QImage.Format.Format_RGB888
-        )
+            qimg = QImage(
+                img_bytestring,
+                self.width,
+                self.height,
+                3 * self.width,
+                QImage.Format.Format_RGB888
+            )
+
+            # Make the QImage own its pixels, so it outlives the bytestring
+            self.blank_images[self.dim] = qimg.copy()
 
-        self.set_image(qimg)
+        self.set_image(self.blank_images[self.dim])
 
     def update_dims(self, max_dim):
         # Change dims
         self.set_dims(max_dim=max_dim)
 
         # Update image
-        if self.bw.filename == None:
+        if self.bw.filename is None:
             self.clear_image()
         else:
             self.set_image(self.image)
@@ -2571,13 +2790,9 @@ class Player:
         duration = self.get_duration()
 
         # Validate it's in range, and if it's not, clip it
-        ms = math.ceil(ms)
-        if ms < 0:
-            ms = 0
-        if ms > duration:
-            ms = duration
+        ms = min(max(math.ceil(ms), 0), duration)
 
-        if self.bw.filename != None:
+        if self.bw.filename is not None:
             self.audio.setPosition(ms)
 
         # If the file is at the end, pause
@@ -2585,20 +2800,30 @@ class Player:
             self.pause()
 
     def set_playbutton_if_given(self, play):
-        if self.set_play_button != None:
+        if self.set_play_button is not None:
             self.set_play_button(play=play)
 
     def set_seekbar_if_given(self, ms):
-        if self.set_seekbar_function != None:
+        if self.set_seekbar_function is not None:
             self.set_seekbar_function(ms)
 
     def state_changed_handler(self, media_state):
         if media_state == self.audio.PlayingState:
             self.set_playbutton_if_given(play=False)
+            self.render_timer.start()
         elif media_state == self.audio.PausedState:
             self.set_playbutton_if_given(play=True)
+            self.render_timer.stop()
         elif media_state == self.audio.StoppedState:
             self.set_playbutton_if_given(play=True)
+            self.render_timer.stop()
+
+    def render_tick(self):
+        # Don't draw frames nobody can see, the next tick after the window comes back catches up
+        if not self.display.isVisible() or self.display.window().isMinimized():
+            return
+
+        self.position_changed(self.get_position())
 
     def play(self):
         self.audio.play()
@@ -2624,19 +2849,22 @@ class Player:
         self.set_position(0)
 
     def set_audio_file(self, filename):
-        if filename == None:
-            url = QUrl(None)
+        if filename is None:
+            media = self.empty_media
         else:
-            url = QUrl.fromLocalFile(self.bw.audio_filename)
-        media = QMediaContent(url)
+            media = QMediaContent(QUrl.fromLocalFile(filename))
         self.audio.setMedia(media)
 
     def open_file(self, filename):
         self.close_file()
+        self.load_file(filename)
+        self.show_file()
 
+    # The slow part of opening a file (computing the audio), it doesn't touch any widgets
+    def load_file(self, filename):
         self.bw.change_filename(filename)
-        self.bw.compute_audio()
 
+    def show_file(self):
         self.set_audio_file(self.bw.audio_filename)
 
         self.set_image_timestamp(self.get_position())
@@ -2655,7 +2883,7 @@ class Player:
         self.clear_image()
 
     def file_is_open(self):
-        if self.bw.filename == None:
+        if self.bw.filename is None:
             return False
         else:
             return True
@@ -2666,8 +2894,12 @@ class Player:
         else:
             return False
 
+    def position_changed(self, ms):
+        self.set_seekbar_if_given(ms)
+        self.set_image_timestamp(ms)
+
     def set_image_timestamp(self, ms):
-        if self.bw.filename == None:
+        if self.bw.filename is None:
             self.clear_image()
         else:
             self.set_image(self.bw.get_frame_qimage(ms))
@@ -2682,12 +2914,18 @@ class Player:
                            sample_rate,
                            volume
                            ):
+        # Re-computing the audio is slow, so skip it if nothing changed
+        new_settings = (num_channels, sample_bytes, sample_rate, volume)
+        if new_settings == (self.bw.num_channels, self.bw.sample_bytes, self.bw.sample_rate, self.bw.volume):
+            return
+
         self.bw.set_audio_settings(
             num_channels=num_channels,
             sample_bytes=sample_bytes,
             sample_rate=sample_rate,
             volume=volume
         )
+
         # Re-open newly computed file
         self.set_audio_file(None)
         self.set_audio_file(self.bw.audio_filename)
@@ -2700,7 +2938,16 @@ class Renderer:
                  binary_waterfall,
                  ):
         self.bw = binary_waterfall
-        self.watermarker = Watermarker()
+        self.watermarker = WATERMARKER
+
+        # How many frames' source images to gather at once when exporting
+        self.frame_batch_size = 64
+
+        # Roughly how many bytes of finished frames can be queued up at once when exporting
+        self.frame_memory_budget = 256 * 1024 * 1024
+
+        # The zlib level for exported PNGs, they're lossless either way, but lower levels save much faster
+        self.png_compress_level = 1
 
     class ImageFormatCode(Enum):
         JPEG = ".jpg"
@@ -2728,20 +2975,56 @@ class Renderer:
                      keep_aspect=False,
                      watermark=False
                      ):
-        self.make_file_path(filename)
+        self.export_image(
+            source=self.get_source_images([ms])[0],
+            filename=filename,
+            size=size,
+            keep_aspect=keep_aspect,
+            watermark=watermark
+        )
 
-        if self.bw.audio_filename == None:
+    def get_source_images(self, ms_list):
+        if self.bw.audio_filename is None:
             # If no file is loaded, make a black image
-            source = Image.new(
-                mode="RGBA",
+            #   Rendering never modifies the source, so every frame can share it
+            blank = Image.new(
+                mode="RGB",
                 size=(self.bw.width, self.bw.height),
                 color="#000"
             )
-        else:
-            source = self.bw.get_frame_image(ms).convert("RGBA")
+            return [blank] * len(ms_list)
+
+        frames = self.bw.get_frames_array(ms_list)
+        # The frames are opaque, so they stay RGB all the way through rendering
+        return [Image.fromarray(frame, "RGB") for frame in frames]
+
+    def export_image(self,
+                     source,
+                     filename,
+                     size=None,
+                     keep_aspect=False,
+                     watermark=False
+                     ):
+        self.make_file_path(filename)
+
+        final = self.render_image(
+            source=source,
+            size=size,
+            keep_aspect=keep_aspect,
+            watermark=watermark
+        )
+
+        # The compression level is ignored by the other image formats
+        final.save(filename, compress_level=self.png_compress_level)
 
+    def render_image(self,
+                     source,
+                     size=None,
+                     keep_aspect=False,
+                     watermark=False
+                     ):
         # Resize with aspect ratio, paste onto black
-        if size == None:
+        if size is None:
             resized = source
         else:
             resized = fit_to_frame(
@@ -2755,9 +3038,12 @@ class Renderer:
         if watermark:
             resized = self.watermarker.mark(resized)
 
-        final = resized.convert("RGB")
+        if resized.mode == "RGB":
+            final = resized
+        else:
+            final = resized.convert("RGB")
 
-        final.save(filename)
+        return final
 
     def export_audio(self, filename):
         filename_main, filename_ext = os.path.splitext(filename)
@@ -2769,18 +3055,79 @@ class Renderer:
             # Just copy the .wav file
             shutil.copy(self.bw.audio_filename, filename)
         elif filename_ext == self.AudioFormatCode.MP3.value:
-            # Use Pydub to export MP3
-            pydub.AudioSegment.from_wav(self.bw.audio_filename).export(filename, format="mp3")
+            # Use FFmpeg to export MP3
+            self.encode_audio(filename, audio_format="mp3")
         elif filename_ext == self.AudioFormatCode.FLAC.value:
-            # Use Pydub to export FLAC
-            pydub.AudioSegment.from_wav(self.bw.audio_filename).export(filename, format="flac")
+            # Use FFmpeg to export FLAC
+            self.encode_audio(filename, audio_format="flac")
+
+    # Encodes the .wav file with FFmpeg, which streams it straight from disk to disk
+    def encode_audio(self, filename, audio_format):
+        # MoviePy's config is where the FFmpeg binary is found, and it's only needed when exporting
+        from moviepy.config import FFMPEG_BINARY
+
+        result = subprocess.run(
+            [
+                FFMPEG_BINARY,
+                "-y",
+                "-loglevel", "error",
+                "-i", self.bw.audio_filename,
+                "-f", audio_format,
+                filename
+            ],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True
+        )
+
+        if result.returncode != 0:
+            raise RuntimeError(f"FFmpeg could not encode the audio: {result.stderr.strip()}")
 
     def get_frame_count(self, fps):
-        audio_duration = self.bw.get_audio_length() / 1000
+        audio_duration = self.bw.audio_length_ms / 1000
         frame_count = round(audio_duration * fps)
 
         return frame_count
 
+    # Computes frames in batches, and runs frame_function(frame, source) on each of them
+    #   The frame functions run on a thread pool, and the results are given back in order
+    #   Only about one frame per worker is queued ahead, so finished frames can't pile up in memory
+    #   If frame_bytes (the size of each result) is given, fewer are queued to stay within the memory budget
+    def process_frames(self, fps, frame_function, frame_bytes=None):
+        frame_count = self.get_frame_count(fps)
+
+        # The timestamp of every frame, computed all at once
+        frame_ms = np.rint((np.arange(frame_count) / fps) * 1000).astype(np.int64)
+
+        workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            max_pending = workers
+            if frame_bytes is not None:
+                max_pending = max(min(max_pending, self.frame_memory_budget // frame_bytes), 1)
+            pending = deque()
+            try:
+                for batch_start in range(0, frame_count, self.frame_batch_size):
+                    batch_frames = range(batch_start, min(batch_start + self.frame_batch_size, frame_count))
+                    batch_ms = frame_ms[batch_frames.start:batch_frames.stop].tolist()
+
+                    # Compute the whole batch of frames in one go
+                    batch_images = self.get_source_images(batch_ms)
+
+                    for frame, source in zip(batch_frames, batch_images):
+                        # Hand back the oldest frame before queueing another one
+                        if len(pending) >= max_pending:
+                            done_frame, done_future = pending.popleft()
+                            yield done_frame, done_future.result()
+
+                        pending.append((frame, executor.submit(frame_function, frame, source)))
+
+                while pending:
+                    done_frame, done_future = pending.popleft()
+                    yield done_frame, done_future.result()
+            finally:
+                # Don't bother finishing queued frames if we stopped early
+                executor.shutdown(wait=True, cancel_futures=True)
+
     def export_sequence(self,
                         directory,
                         fps,
@@ -2799,25 +3146,27 @@ class Renderer:
         if format is None:
             format = self.ImageFormatCode.PNG
 
-        for frame in range(frame_count):
+        def export_sequence_frame(frame, source):
             frame_number = str(frame).rjust(frame_number_digits, "0")
             frame_filename = os.path.join(directory, f"{frame_number}{format.value}")
-            frame_ms = round((frame / fps) * 1000)
-
-            if progress_dialog is not None:
-                progress_dialog.setValue(frame)
-
-                if progress_dialog.wasCanceled():
-                    return
 
-            self.export_frame(
-                ms=frame_ms,
+            self.export_image(
+                source=source,
                 filename=frame_filename,
                 size=size,
                 keep_aspect=keep_aspect,
                 watermark=watermark
             )
 
+        frames = self.process_frames(fps, export_sequence_frame)
+        for frame, export_result in frames:
+            if progress_dialog is not None:
+                progress_dialog.setValue(frame)
+
+                if progress_dialog.wasCanceled():
+                    frames.close()
+                    return
+
         if progress_dialog is not None:
             progress_dialog.setValue(frame_count)
 
@@ -2829,58 +3178,60 @@ class Renderer:
                      watermark=False,
                      progress_dialog=None
                      ):
+        # MoviePy is slow to import, so only load it when exporting
+        from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
+
         # Get temporary directory
         temp_dir = tempfile.mkdtemp()
 
         # Make file names
-        image_dir = os.path.join(temp_dir, "images")
-        audio_file = os.path.join(temp_dir, "audio.wav")
+        audio_file = os.path.join(temp_dir, f"audio{self.AudioFormatCode.MP3.value}")
         filename_main, filename_ext = os.path.splitext(filename)
         filename_path, filename_title = os.path.split(filename)
-        frames_file = os.path.join(temp_dir, "frames.txt")
         video_file = os.path.join(temp_dir, f"video{filename_ext}")
 
+        if size is None:
+            size = (self.bw.width, self.bw.height)
+
         # Set progress dialog to not close when at max
         if progress_dialog is not None:
             progress_dialog.setAutoReset(False)
 
-        # Export image sequence
-        self.export_sequence(
-            directory=image_dir,
-            fps=fps,
-            size=size,
-            keep_aspect=keep_aspect,
-            format=self.ImageFormatCode.PNG,
-            watermark=watermark,
-            progress_dialog=progress_dialog
-        )
-
-        if progress_dialog is not None:
-            if progress_dialog.wasCanceled():
-                shutil.rmtree(temp_dir)
-                return
-
-        # Export audio
+        # Export audio (compressed, so it can be copied straight into any of the video containers)
         self.export_audio(audio_file)
 
-        # Prepare the custom logger to update the progress box
-        custom_logger = QtBarLoggerMoviepy()
-        if progress_dialog is not None:
-            progress_dialog.setLabelText("Splicing final video file...")
-            custom_logger.set_progress_dialog(progress_dialog, start_progress=0)
+        def render_video_frame(frame, source):
+            final = self.render_image(
+                source=source,
+                size=size,
+                keep_aspect=keep_aspect,
+                watermark=watermark
+            )
+
+            return np.asarray(final)
 
-        # Make a list of the image filenames
-        frames_list = list()
-        for frame_filename in os.listdir(image_dir):
-            full_frame_filename = os.path.join(image_dir, frame_filename)
-            frames_list.append(full_frame_filename)
+        # Pipe the raw frames straight into ffmpeg, along with the audio
+        video_writer = FFMPEG_VideoWriter(
+            filename=video_file,
+            size=size,
+            fps=fps,
+            codec="libx264",
+            audiofile=audio_file
+        )
+        try:
+            # Each frame is a full-size RGB array, so limit how many of them can wait on the writer
+            frames = self.process_frames(fps, render_video_frame, frame_bytes=size[0] * size[1] * 3)
+            for frame, frame_array in frames:
+                if progress_dialog is not None:
+                    progress_dialog.setValue(frame)
 
-        # Merge image sequence and audio into final video
-        sequence_clip = ImageSequenceClip(frames_list, fps=fps)
-        audio_clip = AudioFileClip(audio_file)
+                    if progress_dialog.wasCanceled():
+                        frames.close()
+                        break
 
-        video_clip = sequence_clip.set_audio(audio_clip)
-        video_clip.write_videofile(video_file, logger=custom_logger)
+                video_writer.write_frame(frame_array)
+        finally:
+            video_writer.close()
 
         if progress_dialog is not None:
             if progress_dialog.wasCanceled():
@@ -2904,6 +3255,70 @@ class Renderer:
             progress_dialog.setValue(100)
 
 
+# Task progress class
+#   Stands in for a QProgressDialog while a task runs on a worker thread.
+#   Updates are forwarded to the real dialog (if there is one) through queued
+#   signals, and cancellation is read back from a flag set by the dialog
+class TaskProgress(QObject):
+    value_changed = pyqtSignal(int)
+    maximum_changed = pyqtSignal(int)
+    label_changed = pyqtSignal(str)
+    auto_reset_changed = pyqtSignal(bool)
+    finished = pyqtSignal()
+
+    def __init__(self, progress_dialog=None):
+        super().__init__()
+
+        self.canceled = False
+        self.error = None
+
+        if progress_dialog is not None:
+            self.value_changed.connect(progress_dialog.setValue, Qt.QueuedConnection)
+            self.maximum_changed.connect(progress_dialog.setMaximum, Qt.QueuedConnection)
+            self.label_changed.connect(progress_dialog.setLabelText, Qt.QueuedConnection)
+            self.auto_reset_changed.connect(progress_dialog.setAutoReset, Qt.QueuedConnection)
+            progress_dialog.canceled.connect(self.cancel)
+
+    def cancel(self):
+        self.canceled = True
+
+    # Same interface as QProgressDialog, so the renderer can use either
+    def setValue(self, value):
+        self.value_changed.emit(value)
+
+    def setMaximum(self, value):
+        self.maximum_changed.emit(value)
+
+    def setLabelText(self, text):
+        self.label_changed.emit(text)
+
+    def setAutoReset(self, reset):
+        self.auto_reset_changed.emit(reset)
+
+    def wasCanceled(self):
+        return self.canceled
+
+
+# Task worker class
+#   Runs a long function (like an export) on the global thread pool,
+#   reporting when it's done and any error through a TaskProgress object
+class TaskWorker(QRunnable):
+    def __init__(self, function, progress, **kwargs):
+        super().__init__()
+
+        self.function = function
+        self.progress = progress
+        self.kwargs = kwargs
+
+    def run(self):
+        try:
+            self.function(**self.kwargs)
+        except Exception as e:
+            self.progress.error = e
+        finally:
+            self.progress.finished.emit()
+
+
 # Main window class
 #   Handles variables related to the main window.
 #   Any actual program functionality or additional dialogs are
@@ -2911,6 +3326,7 @@ class Renderer:
 class MainWindow:
     def __init__(self, qt_args):
         self.app = QApplication(qt_args)
+        self.app.setStyleSheet(APP_STYLESHEET)
         self.window = MyQMainWindow()
 
     def run(self):